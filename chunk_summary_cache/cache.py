@@ -9,18 +9,242 @@ its current contents and the list of chunk summaries.  When the file contents
 change the cache entry is ignored automatically.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+import atexit
+import errno
 import hashlib
 import json
+import logging
+import mmap
 import os
+import queue
 import threading
+import time
+import weakref
 from pathlib import Path
-from typing import List, Dict
+from typing import BinaryIO, Callable, Iterable, List, Dict
+
+try:  # pragma: no cover - optional fast JSON backend
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional fast hash
+    import blake3  # type: ignore
+except Exception:  # pragma: no cover - fall back to truncated SHA-256
+    blake3 = None  # type: ignore
 
 __all__ = ["ChunkSummaryCache"]
 
+logger = logging.getLogger(__name__)
+
+
+def _dumps(data: object) -> bytes:
+    """Serialise ``data`` to JSON bytes using ``orjson`` when available."""
+
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _cached_hash(path_str: str) -> str:
+    """Return the cache key digest for ``path_str``.
+
+    Keys are not security sensitive so BLAKE3 is preferred when installed and a
+    128-bit truncated SHA-256 digest is used otherwise.
+    """
+
+    data = path_str.encode("utf-8")
+    if blake3 is not None:
+        return blake3.blake3(data).hexdigest()
+    return hashlib.sha256(data).digest()[:16].hex()
+
+
+def _loads(raw: bytes | memoryview) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=256)
+def _load_cached(
+    path_str: str, ino: int, mtime_ns: int, ctime_ns: int, size: int
+) -> Dict[str, object] | None:
+    """Parse the cache file ``path_str`` once per ``stat`` stamp.
+
+    Repeated reads of an unchanged file cost a single ``stat`` call.  Cache
+    files are replaced via ``os.replace`` so the inode usually changes on
+    every write, but filesystems may recycle a freed inode at once.  The
+    stamp therefore also includes ``st_ctime_ns``, which the kernel updates
+    on every write and rename and which ``os.utime`` cannot set back.  The
+    parsed payload is shared between callers and must not be mutated.
+    """
+
+    try:
+        with open(path_str, "rb") as fh:
+            data = _loads(fh.read())
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# Number of cache files opened at once by :meth:`ChunkSummaryCache.get_many`.
+_READ_BATCH = 64
+
+# Upper bound on threads used by :meth:`ChunkSummaryCache.clear`.
+_CLEAR_WORKERS = 8
+
+
+def _unlink_quiet(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _unlink_owned(path: str) -> None:
+    """Delete ``path`` if it is an entry written by :class:`ChunkSummaryCache`.
+
+    Other writers share the directory (``chunking`` stores snippet summaries
+    as ``<digest>.json`` there), so ``.json`` files are only removed when
+    they carry this cache's ``path``/``file_hash`` fields.
+    """
+
+    if path.endswith(".json"):
+        try:
+            with open(path, "rb") as fh:
+                data = _loads(fh.read())
+        except Exception:
+            # already gone, or unreadable and possibly someone else's
+            return
+        if not (isinstance(data, dict) and "path" in data and "file_hash" in data):
+            return
+    _unlink_quiet(path)
+
+
+def _read_mapped(fh: BinaryIO) -> Dict[str, object] | None:
+    """Parse the JSON document in ``fh`` from a read-only memory map."""
+
+    try:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                data = _loads(view)
+    except Exception:  # empty, unreadable or corrupted cache file
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush the directory entry of ``directory`` so a rename survives a crash.
+
+    Platforms or filesystems that cannot sync directories (Windows, some
+    network mounts) are treated as success.
+    """
+
+    flag = getattr(os, "O_DIRECTORY", None)
+    if flag is None:  # pragma: no cover - not supported on this platform
+        return
+    fd = os.open(str(directory), os.O_RDONLY | flag)
+    try:
+        os.fsync(fd)
+    except OSError as exc:
+        if exc.errno not in (errno.ENOTSUP, errno.EINVAL):
+            raise
+    finally:
+        os.close(fd)
+
+
+def _write_file(tmp_file: Path, cache_file: Path, payload: bytes, durable: bool) -> None:
+    """Atomically replace ``cache_file`` with ``payload`` via ``tmp_file``.
+
+    With ``durable`` the data is fsynced before the rename and the parent
+    directory afterwards, following the POSIX write/fsync/rename/fsync(dir)
+    sequence.
+    """
+
+    with tmp_file.open("wb") as fh:
+        fh.write(payload)
+        if durable:
+            fh.flush()
+            os.fsync(fh.fileno())
+    os.replace(tmp_file, cache_file)
+    if durable:
+        _fsync_dir(cache_file.parent)
+
+
+# Single-pass replacement of path separators so arbitrary keys cannot escape
+# the cache directory.
+_KEY_TRANS = str.maketrans({"/": "_", "\\": "_"})
+
+
+_WriteJob = tuple[Path, Path, bytes, bool, Callable[[Exception | None], None]]
+
+
+class _WriteWorker(threading.Thread):
+    """Background thread performing queued ``write`` + ``os.replace`` jobs.
+
+    A single writer serialises all cache file updates so producers never block
+    on disk I/O.  :meth:`join_queue` waits until every queued job is done.  Each
+    job's callback receives the exception raised by the write, if any.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(name="chunk-summary-cache-writer", daemon=True)
+        self.queue: "queue.Queue[_WriteJob]" = queue.Queue()
+
+    def run(self) -> None:  # pragma: no cover - exercised via flush()
+        while True:
+            tmp_file, cache_file, payload, durable, done = self.queue.get()
+            error: Exception | None = None
+            try:
+                _write_file(tmp_file, cache_file, payload, durable)
+            except Exception as exc:
+                logger.exception("failed to write chunk summary cache %s", cache_file)
+                error = exc
+            try:
+                done(error)
+            except Exception:
+                logger.exception("chunk summary cache write callback failed")
+            finally:
+                self.queue.task_done()
+
+    def join_queue(self) -> None:
+        self.queue.join()
+
+
+_WRITER: _WriteWorker | None = None
+_WRITER_LOCK = threading.Lock()
 
-@dataclass
+# Live caches flushed by a single exit hook; held weakly so short-lived
+# instances (e.g. one per temporary directory) can still be collected.
+_INSTANCES: "weakref.WeakSet[ChunkSummaryCache]" = weakref.WeakSet()
+
+
+def _flush_instances() -> None:
+    for cache in list(_INSTANCES):
+        cache.flush_all()
+
+
+atexit.register(_flush_instances)
+
+
+def _get_writer() -> _WriteWorker:
+    """Return the shared writer thread, starting it on first use."""
+
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None or not _WRITER.is_alive():
+            _WRITER = _WriteWorker()
+            _WRITER.start()
+        return _WRITER
+
+
+@dataclass(eq=False)
 class ChunkSummaryCache:
     """Persist summaries for tokenised file chunks on disk.
 
@@ -29,47 +253,156 @@ class ChunkSummaryCache:
     cache_dir:
         Directory used to store JSON cache files.  Defaults to
         ``chunk_summary_cache/`` in the current working directory.
+    flush_interval:
+        Minimum number of seconds between two disk writes for the same entry.
+        Updates arriving within the interval are kept in memory and written by
+        the next :meth:`set` outside the window, :meth:`flush` or at interpreter
+        shutdown.  Instances are only tracked weakly for the shutdown flush, so
+        call :meth:`close` before discarding a cache that may hold updates.
+    durable:
+        When ``True`` cache files and their directory are fsynced on every
+        write so a crash cannot leave a renamed but empty file behind, and
+        failed background writes are re-raised by the next :meth:`flush`.  Off
+        by default since the cache can always be rebuilt.
     """
 
     cache_dir: str | Path = "chunk_summary_cache"
+    flush_interval: float = 5.0
+    durable: bool = False
     _lock: threading.Lock = field(init=False, repr=False)
     _paths: dict[str, Path] = field(init=False, default_factory=dict, repr=False)
+    _files: dict[str, Path] = field(init=False, default_factory=dict, repr=False)
+    _pending: dict[str, Dict[str, object]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _last_flush: dict[str, float] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _inflight: dict[str, Dict[str, object]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+    _write_errors: list[Exception] = field(
+        init=False, default_factory=list, repr=False
+    )
 
     # ------------------------------------------------------------------
     def __post_init__(self) -> None:
         self.cache_dir = Path(self.cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        _INSTANCES.add(self)
 
     # ------------------------------------------------------------------
     def hash_path(self, path: str | Path) -> str:
         """Return a stable hash for ``path`` and remember the mapping."""
 
-        p = Path(path)
-        digest = hashlib.sha256(str(p).encode("utf-8")).hexdigest()
+        p = path if isinstance(path, Path) else Path(path)
+        digest = _cached_hash(str(p))
         self._paths[digest] = p
         return digest
 
     # ------------------------------------------------------------------
     def _cache_file(self, path_hash: str) -> Path:
-        return self.cache_dir / f"{path_hash}.json"
+        cache_file = self._files.get(path_hash)
+        if cache_file is None:
+            name = path_hash.strip().translate(_KEY_TRANS)
+            cache_file = self.cache_dir / f"{name}.json"
+            self._files[path_hash] = cache_file
+        return cache_file
 
     # ------------------------------------------------------------------
     def _file_hash(self, path: Path) -> str:
+        # Always hash the contents: source files are often edited in place or
+        # copied with preserved timestamps, so a stat stamp cannot prove that
+        # they are unchanged.
         return hashlib.sha256(path.read_bytes()).hexdigest()
 
     # ------------------------------------------------------------------
     def get(self, path_hash: str) -> Dict[str, List[Dict[str, object]]] | None:
-        """Return cached summaries for ``path_hash`` if present and current."""
+        """Return cached summaries for ``path_hash`` if present and current.
+
+        Entries that have not been written to disk yet take precedence over the
+        on-disk cache file.  The returned mapping and its ``summaries`` list are
+        copies so callers may modify them; the individual summary dicts are
+        shared with the cache and should be treated as read-only.
+        """
 
         cache_file = self._cache_file(path_hash)
         with self._lock:
-            if not cache_file.exists():
-                return None
+            data = self._pending.get(path_hash) or self._inflight.get(path_hash)
+            if data is None:
+                try:
+                    st = cache_file.stat()
+                except OSError:
+                    return None
+                data = _load_cached(
+                    str(cache_file),
+                    st.st_ino,
+                    st.st_mtime_ns,
+                    st.st_ctime_ns,
+                    st.st_size,
+                )
+                if data is None:
+                    return None
+        return self._validate(path_hash, data)
+
+    # ------------------------------------------------------------------
+    def get_many(
+        self, path_hashes: Iterable[str]
+    ) -> Dict[str, Dict[str, List[Dict[str, object]]] | None]:
+        """Return cached summaries for several ``path_hashes`` at once.
+
+        Cache files are opened in batches with a ``WILLNEED`` read-ahead hint
+        where the platform supports it and parsed directly from a read-only
+        memory map.  Each entry is validated exactly like :meth:`get`.
+        """
+
+        keys = list(dict.fromkeys(path_hashes))
+        found: Dict[str, Dict[str, object]] = {}
+        with self._lock:
+            for key in keys:
+                data = self._pending.get(key) or self._inflight.get(key)
+                if data is not None:
+                    found[key] = data
+        todo = [k for k in keys if k not in found]
+        fadvise = getattr(os, "posix_fadvise", None)
+        for start in range(0, len(todo), _READ_BATCH):
+            handles: list[tuple[str, BinaryIO]] = []
             try:
-                data = json.loads(cache_file.read_text())
-            except Exception:
-                return None
+                for key in todo[start:start + _READ_BATCH]:
+                    try:
+                        fh = self._cache_file(key).open("rb")
+                    except OSError:
+                        continue
+                    handles.append((key, fh))
+                    if fadvise is not None:
+                        try:
+                            fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                        except OSError:  # pragma: no cover - advisory only
+                            pass
+                for key, fh in handles:
+                    data = _read_mapped(fh)
+                    if data is not None:
+                        found[key] = data
+            finally:
+                for _, fh in handles:
+                    fh.close()
+        return {
+            key: (self._validate(key, found[key]) if key in found else None)
+            for key in keys
+        }
+
+    # ------------------------------------------------------------------
+    def _validate(
+        self, path_hash: str, data: Dict[str, object]
+    ) -> Dict[str, List[Dict[str, object]]] | None:
+        """Return a copy of ``data`` unless the source changed since caching.
+
+        ``data`` may be the memoised parse of the cache file or a pending entry,
+        so the mapping and its ``summaries`` list are copied before returning.
+        """
+
+        cache_file = self._cache_file(path_hash)
         path_str = data.get("path")
         file_hash = data.get("file_hash")
         if path_str and file_hash:
@@ -81,12 +414,18 @@ class ChunkSummaryCache:
             if current_hash != file_hash:
                 # file changed -> invalidate cache entry
                 with self._lock:
+                    self._pending.pop(path_hash, None)
+                    self._inflight.pop(path_hash, None)
                     try:
                         cache_file.unlink()
                     except OSError:
                         pass
                 return None
-        return data
+        out = dict(data)
+        summaries = out.get("summaries")
+        if isinstance(summaries, list):
+            out["summaries"] = list(summaries)
+        return out
 
     # ------------------------------------------------------------------
     def set(self, path_hash: str, summaries: List[Dict[str, object]]) -> None:
@@ -102,11 +441,110 @@ class ChunkSummaryCache:
         data = {
             "path": str(path),
             "file_hash": self._file_hash(path),
-            "summaries": summaries,
+            "summaries": list(summaries),
         }
+        with self._lock:
+            self._pending[path_hash] = data
+            last = self._last_flush.get(path_hash)
+            if last is None or time.monotonic() - last > self.flush_interval:
+                self._flush_locked(path_hash)
+
+    # ------------------------------------------------------------------
+    def _flush_locked(self, path_hash: str) -> None:
+        """Queue the pending entry for ``path_hash``; caller holds ``_lock``.
+
+        The payload is serialised synchronously while the file write happens on
+        the shared writer thread.  Until it completes the entry is served from
+        ``_inflight``.
+        """
+
+        data = self._pending.pop(path_hash, None)
+        if data is None:
+            return
+        payload = _dumps(data)
         cache_file = self._cache_file(path_hash)
         tmp_file = cache_file.with_suffix(".tmp")
+        self._inflight[path_hash] = data
+
+        def _done(error: Exception | None) -> None:
+            with self._lock:
+                if self._inflight.get(path_hash) is data:
+                    del self._inflight[path_hash]
+                if error is not None and self.durable:
+                    self._write_errors.append(error)
+
+        _get_writer().queue.put((tmp_file, cache_file, payload, self.durable, _done))
+        self._last_flush[path_hash] = time.monotonic()
+
+    # ------------------------------------------------------------------
+    def flush(self, path_hash: str | None = None) -> None:
+        """Write pending entries to disk and wait for queued writes.
+
+        When ``path_hash`` is given only that entry is flushed, otherwise all
+        pending entries are written.  For ``durable`` caches the first error
+        raised by a background write since the previous flush is re-raised
+        here.
+        """
+
         with self._lock:
-            with tmp_file.open("w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2, sort_keys=True)
-            os.replace(tmp_file, cache_file)
+            if path_hash is not None:
+                self._flush_locked(path_hash)
+            else:
+                for key in list(self._pending):
+                    self._flush_locked(key)
+        writer = _WRITER
+        if writer is not None and writer.is_alive():
+            writer.join_queue()
+        with self._lock:
+            errors, self._write_errors = self._write_errors, []
+        if errors:
+            raise errors[0]
+
+    # ------------------------------------------------------------------
+    def flush_all(self) -> None:
+        """Flush every pending entry, ignoring errors during shutdown."""
+
+        try:
+            self.flush()
+        except Exception:  # pragma: no cover - best effort at exit
+            pass
+
+    # ------------------------------------------------------------------
+    def clear(self) -> None:
+        """Remove every cached entry from memory and disk.
+
+        The directory may be shared with other files, so only entries written
+        by this class and their ``<key>.tmp`` temporaries are deleted.
+        Deletions are spread over a small thread pool as they are I/O bound.
+        """
+
+        with self._lock:
+            self._pending.clear()
+        writer = _WRITER
+        if writer is not None and writer.is_alive():
+            writer.join_queue()
+        with self._lock:
+            self._inflight.clear()
+            self._last_flush.clear()
+        with os.scandir(self.cache_dir) as it:
+            paths = [
+                e.path
+                for e in it
+                if e.name.endswith((".json", ".tmp"))
+                # ``chunking`` writes its temporaries as ``<digest>.json.tmp``
+                and not e.name.endswith(".json.tmp")
+                and e.is_file()
+            ]
+        if len(paths) <= 1:
+            for path in paths:
+                _unlink_owned(path)
+            return
+        with ThreadPoolExecutor(max_workers=min(_CLEAR_WORKERS, len(paths))) as ex:
+            list(ex.map(_unlink_owned, paths))
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Flush pending entries and stop flushing this cache at exit."""
+
+        self.flush()
+        _INSTANCES.discard(self)
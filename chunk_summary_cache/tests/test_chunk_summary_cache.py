@@ -0,0 +1,168 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from chunk_summary_cache import cache as cache_mod  # noqa: E402
+from chunk_summary_cache import ChunkSummaryCache  # noqa: E402
+
+
+def _disk_summaries(cache, key):
+    data = cache_mod._loads(cache._cache_file(key).read_bytes())
+    return data["summaries"]
+
+
+@pytest.fixture
+def source(tmp_path):
+    src = tmp_path / "src.py"
+    src.write_text("a = 1\n")
+    return src
+
+
+def test_debounce_keeps_updates_in_memory(tmp_path, source):
+    cache = ChunkSummaryCache(tmp_path / "cache", flush_interval=3600)
+    key = cache.hash_path(source)
+    cache.set(key, [{"summary": "first"}])
+    cache.flush()
+    cache.set(key, [{"summary": "second"}])
+    cache_mod._get_writer().join_queue()
+
+    # the second update falls inside the window and is not written yet
+    assert _disk_summaries(cache, key) == [{"summary": "first"}]
+    # ...but pending entries take precedence over the on-disk file
+    assert cache.get(key)["summaries"] == [{"summary": "second"}]
+
+    cache.flush()
+    assert _disk_summaries(cache, key) == [{"summary": "second"}]
+    cache.close()
+
+
+def test_background_write_is_visible_to_new_instance(tmp_path, source):
+    cache = ChunkSummaryCache(tmp_path / "cache", flush_interval=0)
+    key = cache.hash_path(source)
+    cache.set(key, [{"summary": "s"}])
+    cache.flush()
+    assert not cache._inflight
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+    other = ChunkSummaryCache(tmp_path / "cache")
+    assert other.get(key)["summaries"] == [{"summary": "s"}]
+    assert other.get_many([key, "missing"]) == {
+        key: other.get(key),
+        "missing": None,
+    }
+    cache.close()
+    other.close()
+
+
+def test_close_flushes_and_unregisters(tmp_path, source):
+    cache = ChunkSummaryCache(tmp_path / "cache", flush_interval=3600)
+    key = cache.hash_path(source)
+    cache.set(key, [{"summary": "first"}])
+    cache.set(key, [{"summary": "last"}])
+    assert cache in cache_mod._INSTANCES
+    cache.close()
+    assert cache not in cache_mod._INSTANCES
+    assert _disk_summaries(cache, key) == [{"summary": "last"}]
+
+
+def test_in_place_edit_with_preserved_mtime_invalidates(tmp_path, source):
+    cache = ChunkSummaryCache(tmp_path / "cache", flush_interval=0)
+    key = cache.hash_path(source)
+    cache.set(key, [{"summary": "s"}])
+    cache.flush()
+    assert cache.get(key) is not None
+
+    st = source.stat()
+    with source.open("r+") as fh:
+        fh.write("b = 2\n")
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert cache.get(key) is None
+    assert not cache._cache_file(key).exists()
+    cache.close()
+
+
+def test_get_returns_copies(tmp_path, source):
+    cache = ChunkSummaryCache(tmp_path / "cache", flush_interval=3600)
+    key = cache.hash_path(source)
+    summaries = [{"summary": "s"}]
+    cache.set(key, summaries)
+    summaries.append({"summary": "caller"})
+    cache.get(key)["summaries"].append({"summary": "pending"})
+    cache.flush()
+    cache.get(key)["summaries"].append({"summary": "disk"})
+    assert cache.get(key)["summaries"] == [{"summary": "s"}]
+    cache.close()
+
+
+def test_durable_write_errors_raise_from_flush(tmp_path, source, monkeypatch):
+    def fail(*_args):
+        raise OSError("fsync failed")
+
+    monkeypatch.setattr(cache_mod, "_write_file", fail)
+    cache = ChunkSummaryCache(tmp_path / "cache", flush_interval=0, durable=True)
+    key = cache.hash_path(source)
+    cache.set(key, [{"summary": "s"}])
+    with pytest.raises(OSError, match="fsync failed"):
+        cache.flush()
+    # the error is reported once
+    cache.flush()
+
+    relaxed = ChunkSummaryCache(tmp_path / "relaxed", flush_interval=0)
+    key = relaxed.hash_path(source)
+    relaxed.set(key, [{"summary": "s"}])
+    # non-durable caches only log failed writes
+    relaxed.flush()
+    cache.close()
+    relaxed.close()
+
+
+def test_clear_keeps_files_it_does_not_own(tmp_path, source):
+    cache_dir = tmp_path / "cache"
+    cache = ChunkSummaryCache(cache_dir, flush_interval=0)
+    key = cache.hash_path(source)
+    cache.set(key, [{"summary": "s"}])
+    cache.flush()
+    # snippet summaries from ``chunking`` live in the same directory
+    snippet = cache_dir / f"{'a' * 64}.json"
+    snippet.write_text('{"hash": "aaaa", "summary": "snippet"}')
+    snippet_tmp = cache_dir / f"{'b' * 64}.json.tmp"
+    snippet_tmp.write_text("{}")
+    stale_tmp = cache._cache_file(key).with_suffix(".tmp")
+    stale_tmp.write_bytes(b"partial")
+
+    cache.clear()
+    assert not cache._cache_file(key).exists()
+    assert not stale_tmp.exists()
+    assert snippet.read_text() == '{"hash": "aaaa", "summary": "snippet"}'
+    assert snippet_tmp.exists()
+    assert cache.get(key) is None
+    cache.close()
+
+
+def test_rewrite_with_same_inode_mtime_and_size_is_reloaded(tmp_path, source):
+    cache = ChunkSummaryCache(tmp_path / "cache", flush_interval=0)
+    key = cache.hash_path(source)
+    cache.set(key, [{"summary": "first"}])
+    cache.flush()
+    assert cache.get(key)["summaries"] == [{"summary": "first"}]
+
+    cache_file = cache._cache_file(key)
+    st = cache_file.stat()
+    raw = cache_file.read_bytes().replace(b'"first"', b'"other"')
+    with cache_file.open("r+b") as fh:
+        fh.write(raw)
+    os.utime(cache_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    after = cache_file.stat()
+    assert (after.st_ino, after.st_mtime_ns, after.st_size) == (
+        st.st_ino,
+        st.st_mtime_ns,
+        st.st_size,
+    )
+
+    assert cache.get(key)["summaries"] == [{"summary": "other"}]
+    cache.close()
@@ -231,22 +231,29 @@ def chunk_file(
 
 def _split_by_lines(lines: List[str], start: int, limit: int) -> List[CodeChunk]:
     out: List[CodeChunk] = []
-    buf: List[str] = []
+    count_tokens = _count_tokens
+    sha256 = hashlib.sha256
+    # ``buf_text`` mirrors ``"\n".join(buf)`` so each candidate line only extends
+    # the running text instead of re-joining the whole buffer.
+    buf_text = ""
+    buf_len = 0
     buf_start = start
     for line in lines:
-        tentative = "\n".join(buf + [line])
-        if _count_tokens(tentative) <= limit or not buf:
-            buf.append(line)
+        tentative = f"{buf_text}\n{line}" if buf_len else line
+        if not buf_len or count_tokens(tentative) <= limit:
+            buf_text = tentative
+            buf_len += 1
             continue
-        text = "\n".join(buf).rstrip()
-        h = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        out.append(CodeChunk(buf_start, buf_start + len(buf) - 1, text, h, _count_tokens(text)))
-        buf_start += len(buf)
-        buf = [line]
-    if buf:
-        text = "\n".join(buf).rstrip()
-        h = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        out.append(CodeChunk(buf_start, buf_start + len(buf) - 1, text, h, _count_tokens(text)))
+        text = buf_text.rstrip()
+        h = sha256(text.encode("utf-8")).hexdigest()
+        out.append(CodeChunk(buf_start, buf_start + buf_len - 1, text, h, count_tokens(text)))
+        buf_start += buf_len
+        buf_text = line
+        buf_len = 1
+    if buf_len:
+        text = buf_text.rstrip()
+        h = sha256(text.encode("utf-8")).hexdigest()
+        out.append(CodeChunk(buf_start, buf_start + buf_len - 1, text, h, count_tokens(text)))
     return out
 
 
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Set
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import AbstractSet, Mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextBuilderConfig:
     ranking_weight: float = 1.0
     roi_weight: float = 1.0
@@ -17,11 +18,11 @@ class ContextBuilderConfig:
     alignment_penalty: float = 0.0
     alert_penalty: float = 0.0
     risk_penalty: float = 0.0
-    roi_tag_penalties: Dict[str, float] = field(default_factory=dict)
+    roi_tag_penalties: Mapping[str, float] = field(default_factory=dict)
     enhancement_weight: float = 0.0
     max_alignment_severity: float = 1.0
     max_alerts: int = 5
-    license_denylist: Set[str] = field(default_factory=set)
+    license_denylist: AbstractSet[str] = field(default_factory=set)
     precise_token_count: bool = True
     max_diff_lines: int = 200
     similarity_metric: str = "cosine"
@@ -29,13 +30,42 @@ class ContextBuilderConfig:
     prompt_score_weight: float = 1.0
     prompt_max_tokens: int = 800
 
+    def finalize(self) -> "ContextBuilderConfig":
+        """Freeze the lookup tables read in ranking loops.
 
-@dataclass
+        ``license_denylist`` becomes a :class:`frozenset` and
+        ``roi_tag_penalties`` a read-only mapping.
+        """
+
+        self.license_denylist = frozenset(self.license_denylist)
+        self.roi_tag_penalties = MappingProxyType(dict(self.roi_tag_penalties))
+        return self
+
+    # ``mappingproxy`` cannot be pickled, so finalized penalties travel as a
+    # plain dict and are re-frozen on restore.
+    def __getstate__(self) -> dict[str, object]:
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        penalties = state["roi_tag_penalties"]
+        if isinstance(penalties, MappingProxyType):
+            state["roi_tag_penalties"] = dict(penalties)
+            state["_frozen_penalties"] = True
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        state = dict(state)
+        frozen = state.pop("_frozen_penalties", False)
+        for name, value in state.items():
+            setattr(self, name, value)
+        if frozen:
+            self.roi_tag_penalties = MappingProxyType(dict(self.roi_tag_penalties))
+
+
+@dataclass(slots=True)
 class LoggingSettings:
     verbosity: str = "INFO"
 
 
-@dataclass
+@dataclass(slots=True)
 class _Config:
     logging: LoggingSettings = field(default_factory=LoggingSettings)
 
@@ -48,16 +78,3 @@ def get_config() -> _Config:  # pragma: no cover - trivial
 
 
 __all__ = ["ContextBuilderConfig", "get_config"]
-config/roi_tag_sentiment.yaml
-New
-+8
--0
-
-# Default ROI tag sentiment used when the enterprise configuration is absent.
-# Positive values increase ranking weights while negative values decrease them.
-SUCCESS: 1.0
-HIGH_ROI: 1.0
-LOW_ROI: -1.0
-BUG_INTRODUCED: -1.0
-NEEDS_REVIEW: -1.0
-BLOCKED: -1.0
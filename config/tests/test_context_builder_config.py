@@ -0,0 +1,45 @@
+import copy
+import pickle
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from config import ContextBuilderConfig  # noqa: E402
+
+
+def _finalized():
+    return ContextBuilderConfig(
+        roi_tag_penalties={"low_roi": -1.0},
+        license_denylist={"GPL-3.0"},
+    ).finalize()
+
+
+def test_finalize_freezes_lookup_tables():
+    cfg = _finalized()
+    assert cfg.license_denylist == frozenset({"GPL-3.0"})
+    assert isinstance(cfg.roi_tag_penalties, MappingProxyType)
+    with pytest.raises(TypeError):
+        cfg.roi_tag_penalties["x"] = 1.0  # type: ignore[index]
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [lambda c: pickle.loads(pickle.dumps(c)), copy.copy, copy.deepcopy],
+)
+def test_finalized_config_round_trips(clone):
+    cfg = _finalized()
+    restored = clone(cfg)
+    assert restored == cfg
+    assert isinstance(restored.roi_tag_penalties, MappingProxyType)
+    assert restored.license_denylist == frozenset({"GPL-3.0"})
+
+
+def test_plain_config_round_trips_unfrozen():
+    cfg = ContextBuilderConfig(roi_tag_penalties={"a": 1.0})
+    restored = pickle.loads(pickle.dumps(cfg))
+    assert restored == cfg
+    assert type(restored.roi_tag_penalties) is dict
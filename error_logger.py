@@ -72,7 +72,7 @@ else:  # pragma: no cover - lightweight runtime stub
     class SelfCodingManager:  # type: ignore
         pass
 
-from governed_embeddings import governed_embed, get_embedder
+from governed_embeddings import governed_embed, governed_embed_many, get_embedder
 try:  # pragma: no cover - allow flat imports
     from .dynamic_path_router import resolve_path, path_for_prompt
 except Exception:  # pragma: no cover - fallback for flat layout
@@ -243,6 +243,28 @@ class ErrorClassifier:
                 self.regex_map[pattern] = err_type
             for phrase in rules.get("semantic", []):
                 self.semantic_map[phrase.lower()] = err_type
+        self._phrase_cache = None
+
+    def _phrase_embeddings(self) -> list[tuple[ErrorCategory, Any]]:
+        """Return ``(label, embedding)`` pairs for ``semantic_map``.
+
+        The phrase embeddings are computed in one batch and reused until the
+        model changes or ``semantic_map`` is rebuilt or extended.
+        """
+
+        cache = getattr(self, "_phrase_cache", None)
+        if cache is not None and cache[0] is self.model:
+            return cache[1]
+        embs = governed_embed_many(self.semantic_map, self.model)
+        pairs = [
+            (label, emb)
+            for label, emb in zip(self.semantic_map.values(), embs)
+            if emb is not None
+        ]
+        # an all-``None`` result usually means the model failed; retry next time
+        if pairs or not self.semantic_map:
+            self._phrase_cache = (self.model, pairs)
+        return pairs
 
     def _load_config(self) -> dict[str, Any]:
         if self.config_path and os.path.exists(self.config_path):
@@ -365,6 +387,7 @@ class ErrorClassifier:
                     updated = True
             elif lower not in self.semantic_map:
                 self.semantic_map[lower] = err_type
+                self._phrase_cache = None
                 rules = config.setdefault(err_type.name, {})
                 sem_list = rules.setdefault("semantic", [])
                 if phrase not in sem_list:
@@ -420,10 +443,7 @@ class ErrorClassifier:
                 if emb is not None:
                     best_score = 0.0
                     best_label: ErrorCategory | None = None
-                    for phrase, label in self.semantic_map.items():
-                        p_emb = governed_embed(phrase, self.model)
-                        if p_emb is None:
-                            continue
+                    for label, p_emb in self._phrase_embeddings():
                         if util:
                             sim = float(util.cos_sim(emb, p_emb))
                         else:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional
 
 try:  # pragma: no cover - optional heavy dependency
     from sentence_transformers import SentenceTransformer
@@ -37,15 +37,8 @@ def get_embedder() -> SentenceTransformer | None:
     return _EMBEDDER
 
 
-def governed_embed(text: str, embedder: SentenceTransformer | None = None) -> Optional[List[float]]:
-    """Return an embedding vector for ``text`` with safety checks.
-
-    The input text is first scanned for disallowed licences.  If any are
-    detected the function returns ``None``.  Secrets are redacted before
-    computing the embedding to avoid storing sensitive data in the vector
-    space.  Any runtime failures during embedding are swallowed and ``None``
-    is returned.
-    """
+def _screen_text(text: str) -> str | None:
+    """Return ``text`` with secrets redacted or ``None`` if it must be skipped."""
 
     if not text:
         return None
@@ -67,6 +60,22 @@ def governed_embed(text: str, embedder: SentenceTransformer | None = None) -> Op
     cleaned = redact(text)
     if cleaned != text:
         logger.warning("redacted secrets prior to embedding")
+    return cleaned
+
+
+def governed_embed(text: str, embedder: SentenceTransformer | None = None) -> Optional[List[float]]:
+    """Return an embedding vector for ``text`` with safety checks.
+
+    The input text is first scanned for disallowed licences.  If any are
+    detected the function returns ``None``.  Secrets are redacted before
+    computing the embedding to avoid storing sensitive data in the vector
+    space.  Any runtime failures during embedding are swallowed and ``None``
+    is returned.
+    """
+
+    cleaned = _screen_text(text)
+    if cleaned is None:
+        return None
     model = embedder or get_embedder()
     if model is None:
         return None
@@ -76,4 +85,41 @@ def governed_embed(text: str, embedder: SentenceTransformer | None = None) -> Op
         return None
 
 
-__all__ = ["governed_embed", "get_embedder"]
+def governed_embed_many(
+    texts: Iterable[str],
+    embedder: SentenceTransformer | None = None,
+    *,
+    as_array: bool = False,
+) -> List[Optional[Any]]:
+    """Return embeddings for ``texts`` using a single batched model call.
+
+    Every text goes through the same checks as :func:`governed_embed`; the
+    result list is aligned with ``texts`` and holds ``None`` for rejected
+    entries.  With ``as_array`` the model's native row vectors (typically NumPy
+    arrays) are returned instead of Python lists.
+    """
+
+    texts = list(texts)
+    results: List[Optional[Any]] = [None] * len(texts)
+    cleaned: List[str] = []
+    positions: List[int] = []
+    for idx, text in enumerate(texts):
+        c = _screen_text(text)
+        if c is not None:
+            cleaned.append(c)
+            positions.append(idx)
+    if not cleaned:
+        return results
+    model = embedder or get_embedder()
+    if model is None:
+        return results
+    try:  # pragma: no cover - external model may fail at runtime
+        vectors = model.encode(cleaned)
+        for idx, vec in zip(positions, vectors):
+            results[idx] = vec if as_array else vec.tolist()
+    except Exception:
+        return [None] * len(texts)
+    return results
+
+
+__all__ = ["governed_embed", "governed_embed_many", "get_embedder"]
@@ -3,7 +3,10 @@ from __future__ import annotations
 """Simplified knowledge graph for cross-database relationships."""
 
 from typing import Iterable, Optional, Callable, List, Dict, TYPE_CHECKING
+from operator import itemgetter
+import heapq
 import logging
+import sys
 from pathlib import Path
 import atexit
 import os
@@ -18,6 +21,11 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     nx = None  # type: ignore
 
+# node prefixes whose names recur across events and are worth interning
+_INTERNED_PREFIXES = frozenset(
+    {"bot", "module", "error_type", "error_category", "tag", "resolution", "model"}
+)
+
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from .unified_event_bus import UnifiedEventBus
 
@@ -83,6 +91,9 @@ class KnowledgeGraph:
     def __init__(self, path: str | Path | None = None) -> None:
         self.graph = nx.DiGraph() if nx else None
         self.path = Path(path) if path else Path("knowledge_graph.gpickle")
+        # cluster label -> ``error_type`` nodes, rebuilt lazily from node
+        # attributes after clustering or loading a graph
+        self._cluster_members: Dict[int | None, List[str]] | None = None
         # attempt to load any existing graph so historical links persist
         if self.graph is not None:
             try:
@@ -91,6 +102,18 @@ class KnowledgeGraph:
                 logger.warning("failed to load knowledge graph: %s", exc)
         atexit.register(self._shutdown_save)
 
+    @staticmethod
+    def _node(prefix: str, value: object) -> str:
+        """Return the node name ``"<prefix>:<value>"``.
+
+        Names for recurring entities (bots, modules, error types, ...) are
+        interned so repeated telemetry shares one string object; one-off
+        names such as memories, insights or code snippets are left alone.
+        """
+
+        key = f"{prefix}:{value}"
+        return sys.intern(key) if prefix in _INTERNED_PREFIXES else key
+
     def _shutdown_save(self) -> None:  # pragma: no cover - best effort
         try:
             self.save(self.path)
@@ -124,6 +147,7 @@ class KnowledgeGraph:
 
             with p.open("rb") as fh:
                 self.graph = pickle.load(fh)
+            self._cluster_members = None
         except Exception as exc:  # pragma: no cover - best effort
             try:
                 logger.warning("failed to load knowledge graph from %s: %s", p, exc)
@@ -178,27 +202,26 @@ class KnowledgeGraph:
             if not add_partial:
                 return
 
-        node = f"bot:{name}"
+        node = self._node("bot", name)
         self.graph.add_node(node)
-        self.graph.add_edge(node, f"tag:{name}", type="tag")
-        for t in tasks:
-            if not t:
-                continue
-            self.graph.add_node(f"task:{t}")
-            self.graph.add_edge(node, f"task:{t}", type="task")
-        for d in deps:
-            if not d:
-                continue
-            self.graph.add_node(f"bot:{d}")
-            self.graph.add_edge(node, f"bot:{d}", type="depends")
+        self.graph.add_edge(node, self._node("tag", name), type="tag")
+        # ``add_edges_from`` creates missing nodes, so one bulk call per edge
+        # type replaces the per-item ``add_node``/``add_edge`` pairs
+        self.graph.add_edges_from(
+            (node, f"task:{t}", {"type": "task"}) for t in tasks if t
+        )
+        self.graph.add_edges_from(
+            (node, self._node("bot", d), {"type": "depends"}) for d in deps if d
+        )
 
     def add_memory_entry(self, key: str, tags: Iterable[str] | None = None) -> None:
         if self.graph is None:
             return
-        self.graph.add_node(f"memory:{key}")
-        for t in tags or []:
-            self.graph.add_node(f"tag:{t}")
-            self.graph.add_edge(f"tag:{t}", f"memory:{key}", type="tag")
+        mnode = self._node("memory", key)
+        self.graph.add_node(mnode)
+        self.graph.add_edges_from(
+            (self._node("tag", t), mnode, {"type": "tag"}) for t in tags or []
+        )
 
     def add_gpt_insight(
         self,
@@ -226,17 +249,18 @@ class KnowledgeGraph:
         if self.graph is None:
             return
 
-        inode = f"insight:{key}"
+        inode = self._node("insight", key)
         self.graph.add_node(inode)
-        for b in bots or []:
-            self.graph.add_node(f"bot:{b}")
-            self.graph.add_edge(inode, f"bot:{b}", type="bot")
-        for c in code_paths or []:
-            self.graph.add_node(f"code:{c}")
-            self.graph.add_edge(inode, f"code:{c}", type="code")
-        for e in error_categories or []:
-            self.graph.add_node(f"error_category:{e}")
-            self.graph.add_edge(inode, f"error_category:{e}", type="error_category")
+        self.graph.add_edges_from(
+            (inode, self._node("bot", b), {"type": "bot"}) for b in bots or []
+        )
+        self.graph.add_edges_from(
+            (inode, self._node("code", c), {"type": "code"}) for c in code_paths or []
+        )
+        self.graph.add_edges_from(
+            (inode, self._node("error_category", e), {"type": "error_category"})
+            for e in error_categories or []
+        )
         # persist immediately so historical relationships survive restarts
         try:
             self.save(self.path)
@@ -375,11 +399,11 @@ class KnowledgeGraph:
     def add_code_snippet(self, summary: str, bots: Iterable[str] | None = None) -> None:
         if self.graph is None:
             return
-        node = f"code:{summary}"
+        node = self._node("code", summary)
         self.graph.add_node(node)
-        for b in bots or []:
-            self.graph.add_node(f"bot:{b}")
-            self.graph.add_edge(f"bot:{b}", node, type="code")
+        self.graph.add_edges_from(
+            (self._node("bot", b), node, {"type": "code"}) for b in bots or []
+        )
 
     def add_pathway(self, actions: str) -> None:
         if self.graph is None:
@@ -387,10 +411,9 @@ class KnowledgeGraph:
         pnode = f"pathway:{actions}"
         self.graph.add_node(pnode)
         steps = [s.strip() for s in actions.split("->") if s.strip()]
-        for i in range(len(steps) - 1):
-            self.graph.add_node(steps[i])
-            self.graph.add_node(steps[i + 1])
-            self.graph.add_edge(steps[i], steps[i + 1], type="next")
+        self.graph.add_edges_from(
+            (src, dst, {"type": "next"}) for src, dst in zip(steps, steps[1:])
+        )
         if steps:
             self.graph.add_edge(pnode, steps[0], type="start")
 
@@ -650,14 +673,14 @@ class KnowledgeGraph:
         if self.graph is None:
             return
 
-        enode = f"error:{error_id}"
+        enode = self._node("error", error_id)
         self.graph.add_node(enode, message=message)
-        for b in bots or []:
-            self.graph.add_node(f"bot:{b}")
-            self.graph.add_edge(enode, f"bot:{b}", type="bot")
-        for m in models or []:
-            self.graph.add_node(f"model:{m}")
-            self.graph.add_edge(enode, f"model:{m}", type="model")
+        self.graph.add_edges_from(
+            (enode, self._node("bot", b), {"type": "bot"}) for b in bots or []
+        )
+        self.graph.add_edges_from(
+            (enode, self._node("model", m), {"type": "model"}) for m in models or []
+        )
         for c in codes or []:
             label = str(c)
             if summary_lookup:
@@ -665,8 +688,9 @@ class KnowledgeGraph:
                     label = summary_lookup(c)
                 except Exception:
                     label = str(c)
-            self.graph.add_node(f"code:{label}")
-            self.graph.add_edge(enode, f"code:{label}", type="code")
+            cnode = self._node("code", label)
+            self.graph.add_node(cnode)
+            self.graph.add_edge(enode, cnode, type="code")
 
     def add_telemetry_event(
         self,
@@ -695,10 +719,12 @@ class KnowledgeGraph:
         if self.graph is None:
             return
 
-        bnode = f"bot:{bot_id}"
+        bnode = self._node("bot", bot_id)
         self.graph.add_node(bnode)
         if error_type:
-            enode = f"error_type:{error_type}"
+            enode = self._node("error_type", error_type)
+            if enode not in self.graph:
+                self._cluster_members = None
             self.graph.add_node(enode)
             # increment node weight for frequency of this error type
             self.graph.nodes[enode]["weight"] = self.graph.nodes[enode].get("weight", 0) + 1
@@ -708,29 +734,29 @@ class KnowledgeGraph:
             self.graph.add_edge(enode, bnode, type="telemetry")
             mods = module_counts or ({root_module: 1} if root_module else {})
             for mod, cnt in mods.items():
-                mnode = f"module:{mod}"
+                mnode = self._node("module", mod)
                 self.graph.add_node(mnode)
                 prev = self.graph.get_edge_data(enode, mnode, {}).get("weight", 0)
                 self.graph.add_edge(enode, mnode, type="module", weight=prev + cnt)
             if root_module:
-                mnode = f"module:{root_module}"
+                mnode = self._node("module", root_module)
                 self.graph.add_node(mnode)
                 prev = self.graph.get_edge_data(mnode, enode, {}).get("weight", 0)
                 self.graph.add_edge(mnode, enode, type="cause", weight=prev + 1)
             if patch_id is not None:
-                pnode = f"patch:{patch_id}"
+                pnode = self._node("patch", patch_id)
                 self.graph.add_node(pnode)
                 self.graph.add_edge(enode, pnode, type="patch")
                 if resolved is not None:
                     outcome = "success" if resolved else "failure"
-                    rnode = f"resolution:{outcome}"
+                    rnode = self._node("resolution", outcome)
                     self.graph.add_node(rnode)
                     prev = self.graph.get_edge_data(pnode, rnode, {}).get("weight", 0)
                     self.graph.add_edge(
                         pnode, rnode, type="resolution", weight=prev + 1
                     )
             if deploy_id is not None:
-                dnode = f"deploy:{deploy_id}"
+                dnode = self._node("deploy", deploy_id)
                 self.graph.add_node(dnode)
                 self.graph.add_edge(enode, dnode, type="deploy")
 
@@ -808,6 +834,7 @@ class KnowledgeGraph:
             self.graph.nodes[enode]["weight"] = weight
         for cnode, weight in cause_totals.items():
             self.graph.nodes[cnode]["weight"] = weight
+        self._cluster_members = None
 
     def ingest_error_db(
         self,
@@ -1048,8 +1075,25 @@ class KnowledgeGraph:
         for node, lbl in zip(errors, labels):
             mapping[node] = int(lbl)
             self.graph.nodes[node]["cluster"] = int(lbl)
+        self._cluster_members = None
         return mapping
 
+    def _error_cluster_members(self, cluster: int | None) -> List[str]:
+        """Return ``error_type`` nodes currently assigned to ``cluster``.
+
+        ``None`` selects error types that have not been clustered yet.
+        """
+
+        if self.graph is None:
+            return []
+        if self._cluster_members is None:
+            index: Dict[int | None, List[str]] = {}
+            for node, data in self.graph.nodes(data=True):
+                if str(node).startswith("error_type:"):
+                    index.setdefault(data.get("cluster"), []).append(node)
+            self._cluster_members = index
+        return self._cluster_members.get(cluster, [])
+
     def cluster_failure_chain(self, error_type: str, top: int = 5) -> List[str]:
         """Return modules most associated with the cluster of ``error_type``."""
 
@@ -1067,12 +1111,11 @@ class KnowledgeGraph:
             if cluster is None:
                 return []
         modules: Dict[str, int] = {}
-        for node, data in self.graph.nodes(data=True):
-            if node.startswith("error_type:") and data.get("cluster") == cluster:
-                for _, m, d in self.graph.out_edges(node, data=True):
-                    if m.startswith("module:"):
-                        modules[m] = modules.get(m, 0) + int(d.get("weight", 1))
-        return [m for m, _ in sorted(modules.items(), key=lambda x: x[1], reverse=True)[:top]]
+        for node in self._error_cluster_members(cluster):
+            for _, m, d in self.graph.out_edges(node, data=True):
+                if m.startswith("module:"):
+                    modules[m] = modules.get(m, 0) + int(d.get("weight", 1))
+        return [m for m, _ in heapq.nlargest(top, modules.items(), key=itemgetter(1))]
 
     def bot_failure_chain(self, bot: str, top: int = 5) -> List[str]:
         """Return likely module failure chain for ``bot`` based on cluster history."""
@@ -1088,7 +1131,7 @@ class KnowledgeGraph:
                 chain = self.cluster_failure_chain(enode, top=top)
                 for m in chain:
                     modules[m] = modules.get(m, 0) + 1
-        return [m for m, _ in sorted(modules.items(), key=lambda x: x[1], reverse=True)[:top]]
+        return [m for m, _ in heapq.nlargest(top, modules.items(), key=itemgetter(1))]
 
     def bot_patch_candidates(self, bot: str, top: int = 3) -> List[str]:
         """Return patch nodes linked to error clusters affecting ``bot``."""
@@ -1106,12 +1149,11 @@ class KnowledgeGraph:
             if cluster is None:
                 self.error_clusters()
                 cluster = self.graph.nodes[enode].get("cluster")
-            for node, data in self.graph.nodes(data=True):
-                if node.startswith("error_type:") and data.get("cluster") == cluster:
-                    for _, pnode, d in self.graph.out_edges(node, data=True):
-                        if pnode.startswith("patch:"):
-                            patches[pnode] = patches.get(pnode, 0) + int(d.get("weight", 1))
-        return [p for p, _ in sorted(patches.items(), key=lambda x: x[1], reverse=True)[:top]]
+            for node in self._error_cluster_members(cluster):
+                for _, pnode, d in self.graph.out_edges(node, data=True):
+                    if pnode.startswith("patch:"):
+                        patches[pnode] = patches.get(pnode, 0) + int(d.get("weight", 1))
+        return [p for p, _ in heapq.nlargest(top, patches.items(), key=itemgetter(1))]
 
     # ------------------------------------------------------------------
     # Traversal helpers
@@ -1,4 +1,9 @@
-"""Package wrapper for :mod:`prompt_failure` utilities."""
+"""Package alias for the :mod:`prompt_failure` utilities.
+
+The implementation lives in the top-level :mod:`prompt_failure` module; this
+wrapper only re-exports it so ``menace.prompt_failure`` and ``prompt_failure``
+share the same exception class.
+"""
 
 from __future__ import annotations
 
@@ -0,0 +1,42 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import db_router  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT * FROM bots", True),
+        ("select 1", True),
+        ("  \n\tSeLeCt 1", True),
+        ("INSERT INTO bots VALUES (1)", False),
+        ("UPDATE bots SET name='select'", False),
+        ("WITH x AS (SELECT 1) SELECT * FROM x", False),
+        ("", False),
+    ],
+)
+def test_is_select(sql, expected):
+    assert db_router._is_select(sql) is expected
+
+
+def test_connections_use_wal_and_relaxed_sync(tmp_path):
+    router = db_router.DBRouter(
+        "alpha", str(tmp_path / "local.db"), str(tmp_path / "shared.db")
+    )
+    try:
+        for conn in (router.local_conn, router.shared_conn):
+            cur = sqlite3.Cursor(conn)
+            assert cur.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # NORMAL == 1
+            assert cur.execute("PRAGMA synchronous").fetchone()[0] == 1
+            # MEMORY == 2
+            assert cur.execute("PRAGMA temp_store").fetchone()[0] == 2
+            cur.close()
+    finally:
+        router.close()
@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import governed_embeddings as ge  # noqa: E402
+
+
+class _Vec(list):
+    def tolist(self):
+        return list(self)
+
+
+class _Model:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model failed")
+        return [_Vec([float(len(t))]) for t in texts]
+
+
+def test_results_align_with_inputs_in_one_call():
+    model = _Model()
+    out = ge.governed_embed_many(["ab", "", "abcd"], model)
+    assert out == [[2.0], None, [4.0]]
+    assert type(out[0]) is list
+    # rejected texts are not sent to the model
+    assert model.calls == [["ab", "abcd"]]
+
+
+def test_as_array_returns_native_rows():
+    out = ge.governed_embed_many(["ab"], _Model(), as_array=True)
+    assert isinstance(out[0], _Vec)
+
+
+def test_model_failure_yields_none_for_every_text():
+    assert ge.governed_embed_many(["ab", "cd"], _Model(fail=True)) == [None, None]
+
+
+def test_nothing_to_embed_skips_the_model(monkeypatch):
+    def fail():
+        raise AssertionError("model should not be loaded")
+
+    monkeypatch.setattr(ge, "get_embedder", fail)
+    assert ge.governed_embed_many(["", ""]) == [None, None]
@@ -0,0 +1,138 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import menace.menace_memory_manager as mmm  # noqa: E402
+
+
+class _Router:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get_connection(self, name):
+        return self.conn
+
+
+class _Embedder:
+    def encode(self, text):
+        return None
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = sqlite3.connect(":memory:")
+    monkeypatch.setattr(mmm, "GLOBAL_ROUTER", _Router(conn))
+    monkeypatch.setattr(mmm, "KnowledgeGraph", lambda: None)
+    yield conn
+    conn.close()
+
+
+def _block_fts(conn):
+    # a plain table of the same name makes the FTS5 backfill fail
+    conn.execute("CREATE TABLE memory_fts(x)")
+
+
+def _manager():
+    return mmm.MenaceMemoryManager(embedder=_Embedder())
+
+
+def _marker(conn):
+    row = conn.execute(
+        "SELECT value FROM memory_meta WHERE name='tag_index'"
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _keys(entries):
+    return sorted(e.key for e in entries)
+
+
+def _seed(conn, *rows):
+    conn.execute(
+        "CREATE TABLE memory(key TEXT, data TEXT, version INTEGER, tags TEXT,"
+        " ts TEXT, bot_id INTEGER, info_id INTEGER)"
+    )
+    conn.executemany(
+        "INSERT INTO memory(key, data, version, tags, ts) VALUES(?, 'd', 1, ?, '')",
+        rows,
+    )
+
+
+def test_fallback_matches_token_prefixes(conn):
+    _block_fts(conn)
+    mgr = _manager()
+    assert not mgr.has_fts
+    for key, tags in [("a", "bot:alpha_v2 bugfix"), ("b", "Bugfix"), ("c", "other")]:
+        mgr.log(mmm.MemoryEntry(key, "d", 1, tags))
+
+    assert _keys(mgr.search_by_tag("BUG")) == ["a", "b"]
+    assert _keys(mgr.search_by_tag("bot:alpha")) == ["a"]
+    assert mgr.search_by_tag("fix") == []
+    assert mgr.search_by_tag(":") == []
+
+
+def test_existing_rows_are_indexed_on_startup(conn):
+    _seed(conn, ("a", "bugfix"), ("b", "other"))
+    _block_fts(conn)
+    mgr = _manager()
+    assert _marker(conn) == mmm._TAG_INDEX_VERSION
+    assert conn.execute("SELECT tag FROM memory_tags ORDER BY tag").fetchall() == [
+        ("bugfix",),
+        ("other",),
+    ]
+    assert _keys(mgr.search_by_tag("bug")) == ["a"]
+
+
+def test_stale_index_version_is_rebuilt(conn):
+    _seed(conn, ("a", "bot:alpha"))
+    _block_fts(conn)
+    conn.execute("CREATE TABLE memory_tags(tag TEXT, rowid INTEGER, PRIMARY KEY(tag, rowid))")
+    conn.execute("CREATE TABLE memory_meta(name TEXT PRIMARY KEY, value TEXT)")
+    # tags indexed by an older format, e.g. unsplit and case-sensitive
+    conn.execute("INSERT INTO memory_tags VALUES('bot:alpha', 1)")
+    conn.execute("INSERT INTO memory_meta VALUES('tag_index', '1')")
+
+    mgr = _manager()
+    assert _marker(conn) == mmm._TAG_INDEX_VERSION
+    assert conn.execute("SELECT tag FROM memory_tags ORDER BY tag").fetchall() == [
+        ("alpha",),
+        ("bot",),
+    ]
+    assert _keys(mgr.search_by_tag("alpha")) == ["a"]
+
+
+def test_index_rebuilt_when_fts_becomes_unavailable(conn):
+    mgr = _manager()
+    if not mgr.has_fts:
+        pytest.skip("sqlite built without FTS5")
+    mgr.log(mmm.MemoryEntry("a", "d", 1, "bugfix"))
+    # FTS serves tag searches, so the fallback index is left stale
+    assert _marker(conn) is None
+    assert conn.execute("SELECT COUNT(*) FROM memory_tags").fetchone()[0] == 0
+
+    mgr.has_fts = False
+    assert _keys(mgr.search_by_tag("bug")) == ["a"]
+    assert _marker(conn) == mmm._TAG_INDEX_VERSION
+    # later entries are indexed as they are logged
+    mgr.log(mmm.MemoryEntry("b", "d", 1, "bugs"))
+    assert _keys(mgr.search_by_tag("bug")) == ["a", "b"]
+
+
+def test_condense_removes_tag_rows(conn, monkeypatch):
+    monkeypatch.setattr(mmm, "_summarise_text", lambda text, ratio=0.2: "short")
+    _block_fts(conn)
+    mgr = _manager()
+    for version in (1, 2):
+        mgr.log(mmm.MemoryEntry("k", f"entry {version}", version, "bugfix"))
+    mgr.log(mmm.MemoryEntry("other", "d", 1, "bugfix"))
+
+    assert mgr.summarise_memory("k", condense=True) == "short"
+    rowids = {r[0] for r in conn.execute("SELECT rowid FROM memory")}
+    tagged = {r[0] for r in conn.execute("SELECT rowid FROM memory_tags")}
+    assert tagged == rowids
+    assert _keys(mgr.search_by_tag("bugfix")) == ["other"]
+    assert _keys(mgr.search_by_tag("summary")) == ["k:summary"]
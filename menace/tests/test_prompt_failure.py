@@ -0,0 +1,51 @@
+import copy
+import logging
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from prompt_failure import PromptBuildError, handle_failure  # noqa: E402
+
+
+def test_prompt_build_error_can_be_constructed():
+    # the former ``@dataclass(slots=True)`` variant raised
+    # ``TypeError: super(type, obj)`` here
+    cause = ValueError("boom")
+    err = PromptBuildError("failed", metadata={"k": 1}, original_exception=cause)
+    assert str(err) == "failed"
+    assert err.message == "failed"
+    assert err.metadata == {"k": 1}
+    assert err.original_exception is cause
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [lambda e: pickle.loads(pickle.dumps(e)), copy.copy, copy.deepcopy],
+)
+def test_prompt_build_error_round_trips(clone):
+    err = PromptBuildError(
+        "failed", metadata={"k": 1}, original_exception=ValueError("boom")
+    )
+    restored = clone(err)
+    assert type(restored) is PromptBuildError
+    assert restored.message == "failed"
+    assert restored.metadata == {"k": 1}
+    assert isinstance(restored.original_exception, ValueError)
+    assert str(restored.original_exception) == "boom"
+
+
+def test_handle_failure_wraps_and_chains():
+    exc = ValueError("boom")
+    with pytest.raises(PromptBuildError) as info:
+        handle_failure("failed", exc, logger=logging.getLogger("test"))
+    assert info.value.__cause__ is exc
+    assert info.value.metadata == {"message": "failed", "exception_type": "ValueError"}
+
+
+def test_prompt_build_error_options_are_keyword_only():
+    with pytest.raises(TypeError):
+        PromptBuildError("failed", {"k": 1})
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from scope_utils import (  # noqa: E402
+    Scope,
+    apply_scope,
+    apply_scope_to_query,
+    build_scope_clause,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("local", Scope.LOCAL),
+        (" LOCAL ", Scope.LOCAL),
+        ("Global", Scope.GLOBAL),
+        ("\tall\n", Scope.ALL),
+        (Scope.ALL, Scope.ALL),
+    ],
+)
+def test_scope_accepts_case_and_whitespace_variants(value, expected):
+    assert Scope(value) is expected
+    assert build_scope_clause("bots", value, "a") == build_scope_clause(
+        "bots", expected, "a"
+    )
+
+
+@pytest.mark.parametrize(
+    "value", ["", "   ", "loc al", "locals", "LOCAL_", "local.", None, 0, b"local"]
+)
+def test_scope_rejects_unknown_values(value):
+    with pytest.raises(ValueError):
+        Scope(value)
+    with pytest.raises(ValueError):
+        build_scope_clause("bots", value, "a")
+
+
+def test_build_scope_clause_per_scope():
+    assert build_scope_clause("bots", Scope.LOCAL, "a") == (
+        "bots.source_menace_id = ?",
+        ["a"],
+    )
+    assert build_scope_clause("bots", "global", "a") == (
+        "bots.source_menace_id <> ?",
+        ["a"],
+    )
+    assert build_scope_clause("bots", Scope.ALL, "a") == ("", [])
+
+
+def test_clause_text_is_shared_but_params_are_not():
+    build_scope_clause.cache_clear()
+    first = build_scope_clause("errors", Scope.LOCAL, "a")
+    second = build_scope_clause("errors", "local", "b")
+    assert first[0] is second[0]
+    assert (first[1], second[1]) == (["a"], ["b"])
+    first[1].append("x")
+    assert build_scope_clause("errors", Scope.LOCAL, "a")[1] == ["a"]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("SELECT * FROM bots", "SELECT * FROM bots WHERE c"),
+        ("SELECT * FROM bots where id=1", "SELECT * FROM bots where id=1 AND c"),
+        ("SELECT * FROM bots\nWHERE id=1", "SELECT * FROM bots\nWHERE id=1 AND c"),
+        ("SELECT somewhere FROM bots", "SELECT somewhere FROM bots WHERE c"),
+    ],
+)
+def test_apply_scope_detects_where_keyword(query, expected):
+    assert apply_scope(query, "c") == expected
+    assert apply_scope(query, "") == query
+
+
+@pytest.mark.parametrize(
+    "query, alias",
+    [
+        ("SELECT * FROM bots", "bots"),
+        ("SELECT * FROM bots b", "b"),
+        ("SELECT * FROM bots AS b WHERE b.id=1", "b"),
+        ("SELECT * FROM bots WHERE id=1", "bots"),
+    ],
+)
+def test_apply_scope_to_query_infers_alias(query, alias):
+    sql, params = apply_scope_to_query(query, "local", "m", params=[1])
+    assert f"{alias}.source_menace_id = ?" in sql
+    assert params == [1, "m"]
+
+
+def test_apply_scope_to_query_requires_alias_without_from():
+    with pytest.raises(ValueError):
+        apply_scope_to_query("SELECT 1", Scope.LOCAL, "m")
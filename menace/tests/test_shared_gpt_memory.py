@@ -0,0 +1,45 @@
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+@pytest.fixture
+def shared_gpt_memory(monkeypatch):
+    monkeypatch.delitem(sys.modules, "shared_gpt_memory", raising=False)
+    loads = []
+
+    class _Module:
+        memory = object()
+
+    def _getattr(name):
+        if name != "LOCAL_KNOWLEDGE_MODULE":
+            raise AttributeError(name)
+        loads.append(name)
+        return _Module
+
+    fake = types.ModuleType("shared_knowledge_module")
+    fake.__getattr__ = _getattr
+    monkeypatch.setitem(sys.modules, "shared_knowledge_module", fake)
+    mod = importlib.import_module("shared_gpt_memory")
+    yield mod, loads, _Module.memory
+    sys.modules.pop("shared_gpt_memory", None)
+
+
+def test_manager_is_resolved_once_on_first_access(shared_gpt_memory):
+    mod, loads, memory = shared_gpt_memory
+    assert loads == []
+    assert mod.GPT_MEMORY_MANAGER is memory
+    assert mod.GPT_MEMORY_MANAGER is memory
+    assert loads == ["LOCAL_KNOWLEDGE_MODULE"]
+
+
+def test_other_names_raise_attribute_error(shared_gpt_memory):
+    mod, loads, _ = shared_gpt_memory
+    with pytest.raises(AttributeError):
+        mod.OTHER
+    assert loads == []
@@ -0,0 +1,126 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from menace.unified_event_bus import UnifiedEventBus  # noqa: E402
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def bus(loop):
+    return UnifiedEventBus(loop=loop)
+
+
+def _recorder(bus, pattern, seen, label=None):
+    bus.subscribe(pattern, lambda t, e: seen.append((label or pattern, t, e)))
+
+
+def test_exact_subscribers_run_before_wildcards(bus):
+    seen = []
+    _recorder(bus, "bot:*", seen)
+    _recorder(bus, "bot:new", seen)
+    bus.publish("bot:new", 1)
+    assert seen == [("bot:new", "bot:new", 1), ("bot:*", "bot:new", 1)]
+
+
+def test_wildcard_matches_exactly_one_segment(bus):
+    seen = []
+    _recorder(bus, "*", seen)
+    _recorder(bus, "bot:*", seen)
+    for topic in ("bot", "bot:new", "bot:new:x"):
+        bus.publish(topic, None)
+    assert [(p, t) for p, t, _ in seen] == [("*", "bot"), ("bot:*", "bot:new")]
+
+
+def test_multi_segment_patterns(bus):
+    seen = []
+    _recorder(bus, "a:*:c", seen)
+    _recorder(bus, "*.record_changed", seen)
+    for topic in ("a:b:c", "a:b:d", "a:b.c", "db.record_changed", "db:record_changed"):
+        bus.publish(topic, None)
+    assert [t for _, t, _ in seen] == ["a:b:c", "db.record_changed"]
+
+
+def test_separators_do_not_alias(bus):
+    seen = []
+    _recorder(bus, "bot:*", seen)
+    bus.publish("bot.new", None)
+    assert seen == []
+    assert not bus.has_subscribers("bot.new")
+    assert bus.has_subscribers("bot:new")
+
+
+def test_async_wildcard_subscribers(bus, loop):
+    seen = []
+
+    async def cb(topic, event):
+        seen.append((topic, event))
+
+    bus.subscribe_async("errors:*", cb)
+    bus.publish("errors:new", 1)
+    bus.publish("errors.new", 2)
+    loop.run_until_complete(asyncio.sleep(0))
+    assert seen == [("errors:new", 1)]
+
+
+def test_publish_many_preserves_order(bus, loop):
+    seen = []
+    async_seen = []
+
+    async def acb(topic, event):
+        async_seen.append(event)
+
+    _recorder(bus, "bot:new", seen, "exact")
+    _recorder(bus, "bot:*", seen, "wild")
+    bus.subscribe_async("bot:new", acb)
+    bus.publish_many("bot:new", iter([1, 2]))
+    loop.run_until_complete(asyncio.sleep(0))
+    assert seen == [
+        ("exact", "bot:new", 1),
+        ("wild", "bot:new", 1),
+        ("exact", "bot:new", 2),
+        ("wild", "bot:new", 2),
+    ]
+    assert async_seen == [1, 2]
+
+
+def test_publish_many_without_subscribers(bus):
+    bus.publish_many("nobody:listens", [1, 2, 3])
+
+
+def test_publish_many_collects_errors(loop):
+    bus = UnifiedEventBus(loop=loop, collect_errors=True)
+    seen = []
+
+    def bad(topic, event):
+        raise ValueError(event)
+
+    bus.subscribe("x", bad)
+    _recorder(bus, "x", seen)
+    bus.publish_many("x", [1, 2])
+    assert [str(e) for e in bus.callback_errors] == ["1", "2"]
+    assert [e for _, _, e in seen] == [1, 2]
+
+
+def test_callback_errors_stay_a_bounded_list(loop):
+    bus = UnifiedEventBus(loop=loop, collect_errors=True, max_collected_errors=3)
+    assert bus.callback_errors == []
+
+    def bad(topic, event):
+        raise ValueError(event)
+
+    bus.subscribe("x", bad)
+    bus.publish_many("x", range(5))
+    assert isinstance(bus.callback_errors, list)
+    assert [str(e) for e in bus.callback_errors[-2:]] == ["3", "4"]
+    assert [str(e) for e in bus.callback_errors] == ["2", "3", "4"]
@@ -12,14 +12,24 @@ The bus also integrates a small review queue so that costly callbacks may be
 audited by :class:`~automated_reviewer.AutomatedReviewer` implementations.
 """
 
-from collections import defaultdict
 from threading import Lock
-from typing import Callable, Dict, List, Optional, Awaitable, Protocol
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
 import asyncio
+import functools
 import threading
 import queue
 import sqlite3
 import json
+import re
 import time
 import logging
 
@@ -39,6 +49,68 @@ from .logging_utils import set_correlation_id
 
 logger = logging.getLogger(__name__)
 
+# topics are namespaced with ``:`` or ``.`` (``bot:new``, ``db.record_changed``);
+# the capturing group keeps each separator as its own trie segment so the two
+# namespaces never alias (``bot:*`` does not match ``bot.new``)
+_TOPIC_SEP_RE = re.compile(r"([.:])")
+_WILDCARD = "*"
+
+
+class _TopicTrie:
+    """Prefix-segment trie resolving wildcard subscriptions.
+
+    Patterns are split into name segments and the ``:``/``.`` separators
+    between them.  ``*`` matches exactly one name segment, so ``bot:*``
+    receives ``bot:new`` but neither ``bot:new:x`` nor ``bot.new``.
+    Lookups walk at most two branches per segment instead of testing every
+    registered pattern.
+    """
+
+    __slots__ = ("children", "callbacks", "async_callbacks")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TopicTrie] = {}
+        self.callbacks: Tuple[Callable[[str, object], None], ...] = ()
+        self.async_callbacks: Tuple[Callable[[str, object], Awaitable[None]], ...] = ()
+
+    def node(self, pattern: str) -> "_TopicTrie":
+        """Return the terminal node for *pattern*, creating it if needed."""
+        node = self
+        for seg in _TOPIC_SEP_RE.split(pattern):
+            child = node.children.get(seg)
+            if child is None:
+                child = node.children[seg] = _TopicTrie()
+            node = child
+        return node
+
+    def match(
+        self, topic: str
+    ) -> Tuple[
+        Tuple[Callable[[str, object], None], ...],
+        Tuple[Callable[[str, object], Awaitable[None]], ...],
+    ]:
+        """Return sync and async callbacks whose pattern matches *topic*."""
+        nodes = [self]
+        for seg in _TOPIC_SEP_RE.split(topic):
+            nxt = []
+            for node in nodes:
+                child = node.children.get(seg)
+                if child is not None:
+                    nxt.append(child)
+                if seg != _WILDCARD:
+                    child = node.children.get(_WILDCARD)
+                    if child is not None:
+                        nxt.append(child)
+            if not nxt:
+                return (), ()
+            nodes = nxt
+        callbacks: Tuple[Callable[[str, object], None], ...] = ()
+        async_callbacks: Tuple[Callable[[str, object], Awaitable[None]], ...] = ()
+        for node in nodes:
+            callbacks += node.callbacks
+            async_callbacks += node.async_callbacks
+        return callbacks, async_callbacks
+
 
 class EventBus(Protocol):
     """Protocol for event bus implementations."""
@@ -71,11 +143,21 @@ class UnifiedEventBus:
         rethrow_errors: bool = False,
         collect_errors: bool = False,
         reviewer: Optional[AutomatedReviewer] = None,
+        max_collected_errors: int = 10_000,
     ) -> None:
-        self._subs: Dict[str, List[Callable[[str, object], None]]] = defaultdict(list)
-        self._async_subs: Dict[str, List[Callable[[str, object], Awaitable[None]]]] = (
-            defaultdict(list)
-        )
+        # Callbacks are stored as immutable per-topic tuples which are rebuilt
+        # on subscribe, so ``publish`` can iterate the current snapshot
+        # without copying it or taking the lock.
+        self._subs: Dict[str, Tuple[Callable[[str, object], None], ...]] = {}
+        self._async_subs: Dict[
+            str, Tuple[Callable[[str, object], Awaitable[None]], ...]
+        ] = {}
+        # topics with at least one local subscriber; lets ``publish`` skip
+        # events nobody listens to with a single membership test
+        self._topics: frozenset[str] = frozenset()
+        # wildcard patterns such as ``bot:*``; created on first use so the
+        # common exact-topic path never walks a trie
+        self._wildcards: Optional[_TopicTrie] = None
         self._lock = Lock()
         self._loop = loop
         if self._loop is None:
@@ -89,7 +171,11 @@ class UnifiedEventBus:
         self._circuit: CircuitBreaker | None = None
         self._rethrow_errors = rethrow_errors
         self._collect_errors = collect_errors
+        # a plain list trimmed to the newest ``max_collected_errors`` entries so
+        # long-running buses collecting errors do not grow without limit
         self.callback_errors: List[Exception] = []
+        self._max_collected_errors = max(1, max_collected_errors)
+        self._dropped_errors = 0
         self._review_queue: queue.Queue[object] = queue.Queue()
         self._review_stop = threading.Event()
         self._review_thread: Optional[threading.Thread] = None
@@ -114,22 +200,97 @@ class UnifiedEventBus:
             self._persist.commit()
 
     def subscribe(self, topic: str, callback: Callable[[str, object], None]) -> None:
-        """Register *callback* to receive events for *topic*."""
+        """Register *callback* to receive events for *topic*.
+
+        A ``*`` segment in *topic* matches any single segment of a published
+        topic, e.g. ``bot:*`` receives both ``bot:new`` and ``bot:updated``.
+        """
         if self._network:
             self._network.subscribe(topic, callback)
             return
+        safe = self._guard(callback)
         with self._lock:
-            self._subs[topic].append(callback)
+            if _WILDCARD in topic:
+                if self._wildcards is None:
+                    self._wildcards = _TopicTrie()
+                node = self._wildcards.node(topic)
+                node.callbacks += (safe,)
+                return
+            self._subs[topic] = self._subs.get(topic, ()) + (safe,)
+            self._topics = self._topics | {topic}
 
     def subscribe_async(
         self, topic: str, callback: Callable[[str, object], Awaitable[None]]
     ) -> None:
-        """Register an async callback for *topic*."""
+        """Register an async callback for *topic*.
+
+        Wildcard patterns behave as for :meth:`subscribe`.
+        """
         if self._network:
             self._network.subscribe_async(topic, callback)
             return
         with self._lock:
-            self._async_subs[topic].append(callback)
+            if _WILDCARD in topic:
+                if self._wildcards is None:
+                    self._wildcards = _TopicTrie()
+                node = self._wildcards.node(topic)
+                node.async_callbacks += (callback,)
+                return
+            self._async_subs[topic] = self._async_subs.get(topic, ()) + (callback,)
+            self._topics = self._topics | {topic}
+
+    def _record_error(self, exc: Exception) -> None:
+        """Append *exc* to ``callback_errors``, dropping the oldest past the cap."""
+        errors = self.callback_errors
+        errors.append(exc)
+        excess = len(errors) - self._max_collected_errors
+        if excess > 0:
+            del errors[:excess]
+            if not self._dropped_errors:
+                logger.warning(
+                    "callback_errors exceeded %d entries; discarding the oldest",
+                    self._max_collected_errors,
+                )
+            self._dropped_errors += excess
+
+    def _guard(
+        self, callback: Callable[[str, object], None]
+    ) -> Callable[[str, object], None]:
+        """Wrap *callback* with the bus' error handling.
+
+        Done once per subscription so the dispatch loop in :meth:`publish`
+        is a plain call per subscriber.
+        """
+
+        @functools.wraps(callback)
+        def _safe(topic: str, event: object) -> None:
+            try:
+                callback(topic, event)
+            except Exception as exc:
+                logger.error("subscriber failed", exc_info=True)
+                if self._collect_errors:
+                    self._record_error(exc)
+                if self._rethrow_errors:
+                    raise
+
+        return _safe
+
+    def has_subscribers(self, topic: str) -> bool:
+        """Return ``True`` if publishing to *topic* could reach anyone.
+
+        Producers can use this to avoid building expensive payloads for
+        topics without listeners.  Networked and persisting buses always
+        report ``True`` since remote subscribers and the event log are not
+        tracked locally.
+        """
+        if (
+            self._network is not None
+            or self._persist is not None
+            or topic in self._topics
+        ):
+            return True
+        wildcards = self._wildcards
+        return wildcards is not None and any(wildcards.match(topic))
 
     # ------------------------------------------------------------------
     def _ensure_review_consumer(self) -> None:
@@ -171,11 +332,18 @@ class UnifiedEventBus:
 
     def publish(self, topic: str, event: object) -> None:
         """Send *event* to all subscribers of *topic*."""
+        if (
+            topic not in self._topics
+            and self._wildcards is None
+            and self._network is None
+            and self._persist is None
+        ):
+            return
         if isinstance(event, dict) and "correlation_id" in event:
             set_correlation_id(str(event.get("correlation_id")))
         if self._network:
-            callbacks: List[Callable[[str, object], None]] = []
-            async_callbacks: List[Callable[[str, object], Awaitable[None]]] = []
+            callbacks: Tuple[Callable[[str, object], None], ...] = ()
+            async_callbacks: Tuple[Callable[[str, object], Awaitable[None]], ...] = ()
             try:
                 assert self._circuit is not None
                 retry_with_backoff(
@@ -186,19 +354,17 @@ class UnifiedEventBus:
             except CircuitOpenError as exc:
                 logger.error("event bus circuit open: %s", exc)
                 if self._collect_errors:
-                    self.callback_errors.append(exc)
+                    self._record_error(exc)
                 if self._rethrow_errors:
                     raise
             except Exception as exc:  # pragma: no cover - runtime issues
                 logger.warning("event publication failed: %s", exc, exc_info=True)
                 if self._collect_errors:
-                    self.callback_errors.append(exc)
+                    self._record_error(exc)
                 if self._rethrow_errors:
                     raise
         else:
-            with self._lock:
-                callbacks = list(self._subs.get(topic, []))
-                async_callbacks = list(self._async_subs.get(topic, []))
+            callbacks, async_callbacks = self._local_callbacks(topic)
         if self._persist:
             try:
                 self._persist.execute(
@@ -209,18 +375,59 @@ class UnifiedEventBus:
             except Exception as exc:
                 logger.error("failed persisting event", exc_info=True)
                 if self._collect_errors:
-                    self.callback_errors.append(exc)
+                    self._record_error(exc)
                 if self._rethrow_errors:
                     raise
+        self._dispatch(topic, event, callbacks, async_callbacks)
+
+    def publish_many(self, topic: str, events: Iterable[object]) -> None:
+        """Send each of *events* to the subscribers of *topic* in order.
+
+        Equivalent to calling :meth:`publish` for every event, but on a local
+        bus the subscribers are resolved once for the whole batch.
+        """
+        if self._network is not None or self._persist is not None:
+            for event in events:
+                self.publish(topic, event)
+            return
+        if topic not in self._topics and self._wildcards is None:
+            return
+        callbacks, async_callbacks = self._local_callbacks(topic)
+        if not callbacks and not async_callbacks:
+            return
+        for event in events:
+            if isinstance(event, dict) and "correlation_id" in event:
+                set_correlation_id(str(event.get("correlation_id")))
+            self._dispatch(topic, event, callbacks, async_callbacks)
+
+    def _local_callbacks(
+        self, topic: str
+    ) -> Tuple[
+        Tuple[Callable[[str, object], None], ...],
+        Tuple[Callable[[str, object], Awaitable[None]], ...],
+    ]:
+        """Return the sync and async callbacks registered for *topic*."""
+        callbacks = self._subs.get(topic, ())
+        async_callbacks = self._async_subs.get(topic, ())
+        if self._wildcards is not None:
+            wild, wild_async = self._wildcards.match(topic)
+            if wild:
+                callbacks += wild
+            if wild_async:
+                async_callbacks += wild_async
+        return callbacks, async_callbacks
+
+    def _dispatch(
+        self,
+        topic: str,
+        event: object,
+        callbacks: Tuple[Callable[[str, object], None], ...],
+        async_callbacks: Tuple[Callable[[str, object], Awaitable[None]], ...],
+    ) -> None:
+        """Deliver *event* to the given callbacks and reset the correlation id."""
+        # callbacks are pre-wrapped by ``_guard`` at subscribe time
         for cb in callbacks:
-            try:
-                cb(topic, event)
-            except Exception as exc:
-                logger.error("subscriber failed", exc_info=True)
-                if self._collect_errors:
-                    self.callback_errors.append(exc)
-                if self._rethrow_errors:
-                    raise
+            cb(topic, event)
         for acb in async_callbacks:
             if self._loop:
 
@@ -230,7 +437,7 @@ class UnifiedEventBus:
                     except Exception as exc:  # pragma: no cover - runtime errors
                         logger.error("async subscriber failed", exc_info=True)
                         if self._collect_errors:
-                            self.callback_errors.append(exc)
+                            self._record_error(exc)
                         if self._rethrow_errors:
                             raise
 
@@ -239,7 +446,7 @@ class UnifiedEventBus:
                 except Exception as exc:
                     logger.error("scheduling async subscriber failed", exc_info=True)
                     if self._collect_errors:
-                        self.callback_errors.append(exc)
+                        self._record_error(exc)
                     if self._rethrow_errors:
                         raise
         set_correlation_id(None)
@@ -257,7 +464,7 @@ class UnifiedEventBus:
             except Exception as exc:  # pragma: no cover - optional
                 logger.error("failed closing networked bus", exc_info=True)
                 if self._collect_errors:
-                    self.callback_errors.append(exc)
+                    self._record_error(exc)
                 if self._rethrow_errors:
                     raise
         if self._review_thread:
@@ -295,7 +502,7 @@ class UnifiedEventBus:
         except Exception as exc:
             logger.error("failed flag_for_review", exc_info=True)
             if self._collect_errors:
-                self.callback_errors.append(exc)
+                self._record_error(exc)
             if self._rethrow_errors:
                 raise
 
@@ -1,45 +1,75 @@
 """Public interface for the :mod:`vector_service` package.
 
 This package provides the canonical vector retrieval service.
+
+Public names are resolved lazily on first access (:pep:`562`) so importing
+the package, or a single helper from it, does not pull in every submodule and
+its heavy optional dependencies.
 """
 
-try:  # pragma: no cover - optional heavy dependencies
-    from .retriever import Retriever, FallbackResult
-    from .patch_logger import PatchLogger
-    from .cognition_layer import CognitionLayer
-    from .embedding_backfill import EmbeddingBackfill
-    from .vectorizer import SharedVectorService
-    from .context_builder import ContextBuilder
-    from .exceptions import (
-        VectorServiceError,
-        RateLimitError,
-        MalformedPromptError,
-    )
-except Exception:  # pragma: no cover - lightweight fallbacks for tests
-    class _Stub:  # type: ignore
-        def __init__(self, *args, **kwargs):
-            pass
-
-    Retriever = PatchLogger = CognitionLayer = EmbeddingBackfill = SharedVectorService = ContextBuilder = _Stub  # type: ignore
-
-    class FallbackResult(list):
-        pass
+import importlib
+from typing import Any
+
+
+class ErrorResult(Exception):
+    """Fallback error result used when retriever returns an error."""
+
+    pass
+
+
+# public name -> module providing it (relative names resolve in this package)
+_LAZY_ATTRS = {
+    "Retriever": ".retriever",
+    "FallbackResult": ".retriever",
+    "PatchLogger": ".patch_logger",
+    "CognitionLayer": ".cognition_layer",
+    "EmbeddingBackfill": ".embedding_backfill",
+    "SharedVectorService": ".vectorizer",
+    "ContextBuilder": ".context_builder",
+    "VectorServiceError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "MalformedPromptError": ".exceptions",
+    "EmbeddableDBMixin": "embeddable_db_mixin",
+}
 
-    class VectorServiceError(Exception):
+
+class _Stub:  # pragma: no cover - lightweight fallbacks for tests
+    def __init__(self, *args, **kwargs):
         pass
 
-    RateLimitError = MalformedPromptError = VectorServiceError
 
+class _FallbackResult(list):  # pragma: no cover - lightweight fallbacks for tests
+    pass
 
-class ErrorResult(Exception):
-    """Fallback error result used when retriever returns an error."""
 
+class _VectorServiceError(Exception):  # pragma: no cover - lightweight fallbacks
     pass
 
-try:  # pragma: no cover - optional dependency used in tests
-    from embeddable_db_mixin import EmbeddableDBMixin  # type: ignore
-except Exception:  # pragma: no cover - fallback when dependency missing
-    EmbeddableDBMixin = object  # type: ignore
+
+_FALLBACKS = {
+    "FallbackResult": _FallbackResult,
+    "VectorServiceError": _VectorServiceError,
+    "RateLimitError": _VectorServiceError,
+    "MalformedPromptError": _VectorServiceError,
+    "EmbeddableDBMixin": object,
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:  # pragma: no cover - optional heavy dependencies
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except Exception:  # pragma: no cover - lightweight fallbacks for tests
+        value = _FALLBACKS.get(name, _Stub)
+    # cache so later lookups are plain module attribute loads
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
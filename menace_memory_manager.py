@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import sqlite3
 import json
-from dataclasses import dataclass
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, Sequence, Any
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Any
 import logging
 
 from db_router import GLOBAL_ROUTER
@@ -103,8 +103,36 @@ except Exception:  # pragma: no cover - fallback summariser
         return ". ".join(sentences[:count]) + "."
 
 
-@dataclass
-class MemoryEntry:
+_TAG_SPLIT_RE = re.compile(r"[,\s]+")
+
+# Tokens as produced by FTS5's default ``unicode61`` tokenizer: runs of
+# letters and digits, everything else (``:``, ``_``, whitespace...) separates.
+_TAG_TOKEN_RE = re.compile(r"[^\W_]+")
+
+# Stored in ``memory_meta`` once ``memory_tags`` has been built from the
+# ``memory`` table; bump it when the indexed tag format changes.
+_TAG_INDEX_VERSION = "2"
+
+
+def _split_tags(tags: str) -> List[str]:
+    """Return the individual tags contained in a comma/space separated string."""
+
+    return [t for t in _TAG_SPLIT_RE.split(tags) if t]
+
+
+def _tag_tokens(tags: str) -> List[str]:
+    """Return the lower-cased search tokens of ``tags``.
+
+    Mirrors how ``memory_fts`` indexes the column so the ``memory_tags``
+    fallback matches the same entries as ``tags MATCH 'tag*'``.
+    """
+
+    return _TAG_TOKEN_RE.findall(tags.lower())
+
+
+class MemoryEntry(NamedTuple):
+    """Immutable versioned memory record as stored in the ``memory`` table."""
+
     key: str
     data: str
     version: int
@@ -134,7 +162,9 @@ class MenaceMemoryManager(GPTMemoryInterface):
             raise RuntimeError("Database router is not initialised")
         with GLOBAL_ROUTER.get_connection("memory") as conn:
             self.conn = conn
-        self.subscribers: List[Callable[[MemoryEntry], None]] = []
+        # Replaced wholesale on (un)subscribe so ``log`` can iterate the current
+        # tuple without copying it for every entry.
+        self.subscribers: Tuple[Callable[[MemoryEntry], None], ...] = ()
         self.event_bus = event_bus
         self.bot_db = bot_db
         self.info_db = info_db
@@ -177,6 +207,20 @@ class MenaceMemoryManager(GPTMemoryInterface):
             self.has_fts = True
         except sqlite3.OperationalError:
             self.has_fts = False
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS memory_tags(tag TEXT, rowid INTEGER, PRIMARY KEY(tag, rowid))"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS memory_meta(name TEXT PRIMARY KEY, value TEXT)"
+        )
+        # ``memory_tags`` only backs ``search_by_tag`` when FTS is unavailable,
+        # so it is maintained (and rebuilt when stale) only in that case.
+        row = self.conn.execute(
+            "SELECT value FROM memory_meta WHERE name='tag_index'"
+        ).fetchone()
+        self._tag_index_current = bool(row and row[0] == _TAG_INDEX_VERSION)
+        if not self.has_fts and not self._tag_index_current:
+            self._rebuild_tag_index()
         self.conn.execute(
             "CREATE TABLE IF NOT EXISTS memory_embeddings(rowid INTEGER PRIMARY KEY, embedding TEXT)"
         )
@@ -198,13 +242,29 @@ class MenaceMemoryManager(GPTMemoryInterface):
             except Exception:
                 self._vector_index = None
 
+    def _rebuild_tag_index(self) -> None:
+        """Repopulate ``memory_tags`` from ``memory`` and record it as built."""
+        rows = self.conn.execute("SELECT rowid, tags FROM memory").fetchall()
+        self.conn.execute("DELETE FROM memory_tags")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO memory_tags(tag, rowid) VALUES(?, ?)",
+            ((tok, rowid) for rowid, tags in rows for tok in _tag_tokens(tags or "")),
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO memory_meta(name, value) VALUES('tag_index', ?)",
+            (_TAG_INDEX_VERSION,),
+        )
+        self._tag_index_current = True
+
     def subscribe(self, callback: Callable[[MemoryEntry], None]) -> None:
         """Register a callback to receive new memory entries."""
-        self.subscribers.append(callback)
+        self.subscribers = self.subscribers + (callback,)
 
     def unsubscribe(self, callback: Callable[[MemoryEntry], None]) -> None:
-        if callback in self.subscribers:
-            self.subscribers.remove(callback)
+        subs = list(self.subscribers)
+        if callback in subs:
+            subs.remove(callback)
+            self.subscribers = tuple(subs)
 
     def _embed(self, text: str) -> Optional[List[float]]:
         return governed_embed(text, self.embedder)
@@ -411,10 +471,23 @@ class MenaceMemoryManager(GPTMemoryInterface):
                 )
             except sqlite3.OperationalError:
                 self.has_fts = False
+        if getattr(self, "has_fts", False):
+            # FTS serves tag searches; mark ``memory_tags`` stale instead of
+            # paying for a second index on every insert
+            if getattr(self, "_tag_index_current", False):
+                self.conn.execute("DELETE FROM memory_meta WHERE name='tag_index'")
+                self._tag_index_current = False
+        elif getattr(self, "_tag_index_current", False):
+            tokens = _tag_tokens(entry.tags)
+            if tokens:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO memory_tags(tag, rowid) VALUES(?, ?)",
+                    [(t, rowid) for t in tokens],
+                )
+        tag_list = _split_tags(entry.tags)
         self.conn.commit()
         if self.graph:
             try:
-                tag_list = [t.strip() for t in entry.tags.replace(",", " ").split() if t.strip()]
                 self.graph.add_memory_entry(entry.key, tag_list)
                 if any(t in {"improvement", "bugfix"} for t in tag_list):
                     bots = [t.split(":", 1)[1] for t in tag_list if t.startswith("bot:")]
@@ -434,7 +507,7 @@ class MenaceMemoryManager(GPTMemoryInterface):
                 logger.exception(
                     "Failed to update knowledge graph for key %s", entry.key
                 )
-        for cb in list(self.subscribers):
+        for cb in self.subscribers:
             try:
                 cb(entry)
             except Exception:
@@ -475,6 +548,13 @@ class MenaceMemoryManager(GPTMemoryInterface):
         return [MemoryEntry(*r) for r in rows]
 
     def search_by_tag(self, tag: str) -> List[MemoryEntry]:
+        """Return entries whose tags contain every word of ``tag`` as a prefix.
+
+        Tags and query are split into case-insensitive alphanumeric tokens, the
+        same way the FTS index does, so ``"bug"`` matches ``"Bugfix"`` and
+        ``"bot:alpha"`` matches ``"bot:alpha_v2"``; substrings inside a word
+        (``"fix"`` for ``"bugfix"``) do not match.
+        """
         if getattr(self, "has_fts", False):
             try:
                 cur = self.conn.execute(
@@ -485,9 +565,26 @@ class MenaceMemoryManager(GPTMemoryInterface):
                 return [MemoryEntry(*r) for r in rows]
             except sqlite3.OperationalError:
                 self.has_fts = False
+        # ``memory_tags`` holds the same lower-cased tokens as the FTS index and
+        # is keyed by token, so every query token becomes an indexed prefix
+        # range instead of a ``LIKE`` scan over all rows.
+        tokens = _tag_tokens(tag)
+        if not tokens:
+            return []
+        if not getattr(self, "_tag_index_current", False):
+            # FTS was available when entries were logged or just failed
+            self._rebuild_tag_index()
+            self.conn.commit()
+        subquery = " INTERSECT ".join(
+            ["SELECT rowid FROM memory_tags WHERE tag >= ? AND tag < ?"] * len(tokens)
+        )
+        params: List[str] = []
+        for tok in tokens:
+            params += (tok, f"{tok}\U0010ffff")
         cur = self.conn.execute(
-            "SELECT key, data, version, tags, ts FROM memory WHERE tags LIKE ?",
-            (f"%{tag}%",),
+            "SELECT key, data, version, tags, ts FROM memory "
+            f"WHERE rowid IN ({subquery})",
+            params,
         )
         rows = cur.fetchall()
         return [MemoryEntry(*r) for r in rows]
@@ -664,6 +761,10 @@ class MenaceMemoryManager(GPTMemoryInterface):
                 f"DELETE FROM memory_clusters WHERE rowid IN ({placeholders})",
                 rowids,
             )
+            self.conn.execute(
+                f"DELETE FROM memory_tags WHERE rowid IN ({placeholders})",
+                rowids,
+            )
             if getattr(self, "has_fts", False):
                 try:
                     self.conn.execute(
@@ -10,14 +10,13 @@ behaviour relied on by the surrounding code.
 
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
 from typing import Mapping, MutableMapping, Any
 
 __all__ = ["PromptBuildError", "handle_failure"]
 
 
-@dataclass(slots=True)
 class PromptBuildError(RuntimeError):
     """Exception raised when constructing an LLM prompt fails.
 
@@ -35,9 +34,11 @@ class PromptBuildError(RuntimeError):
         ``__cause__`` when raised via :func:`handle_failure`.
     """
 
+    __slots__ = ("message", "metadata", "original_exception")
+
     message: str
     metadata: MutableMapping[str, Any]
-    original_exception: Exception | None = None
+    original_exception: Exception | None
 
     def __init__(
         self,
@@ -47,9 +48,20 @@ class PromptBuildError(RuntimeError):
         original_exception: Exception | None = None,
     ) -> None:
         super().__init__(message)
-        object.__setattr__(self, "message", message)
-        object.__setattr__(self, "metadata", dict(metadata or {}))
-        object.__setattr__(self, "original_exception", original_exception)
+        self.message = message
+        self.metadata = dict(metadata or {})
+        self.original_exception = original_exception
+
+    def __reduce__(self):
+        # ``BaseException.__reduce__`` only carries ``args`` and ``__dict__``;
+        # slot attributes have to be passed back to the (keyword-only)
+        # constructor arguments.
+        factory = functools.partial(
+            type(self),
+            metadata=self.metadata,
+            original_exception=self.original_exception,
+        )
+        return (factory, (self.message,))
 
 
 # Default logger used when callers do not provide one.
@@ -63,6 +75,7 @@ def handle_failure(
     logger: logging.Logger | None = None,
     raise_error: bool = True,
     metadata: Mapping[str, Any] | None = None,
+    _log: logging.Logger = _LOGGER,
 ) -> None:
     """Log a prompt build failure and optionally raise a wrapped exception.
 
@@ -74,10 +87,14 @@ def handle_failure(
     exceptions.
     """
 
-    log = logger if logger is not None else _LOGGER
-    details: MutableMapping[str, Any] = dict(metadata or {})
-    details.setdefault("message", message)
-    details.setdefault("exception_type", exc.__class__.__name__)
+    log = logger if logger is not None else _log
+    details: MutableMapping[str, Any]
+    if metadata:
+        details = dict(metadata)
+        details.setdefault("message", message)
+        details.setdefault("exception_type", exc.__class__.__name__)
+    else:
+        details = {"message": message, "exception_type": exc.__class__.__name__}
 
     try:
         log.exception(message, exc_info=exc, extra={"metadata": details})
@@ -30,10 +30,19 @@ flags with a single ``scope`` parameter.
 """
 
 from enum import Enum
+from functools import lru_cache
 import re
 from typing import Any, List, Tuple, Sequence
 
 
+# Matches a ``WHERE`` keyword in any case without allocating a lower-cased
+# copy of the query.
+_WHERE_RE = re.compile(r"\bwhere\b", re.IGNORECASE)
+_FROM_RE = re.compile(
+    r"FROM\s+([^\s,]+)(?:\s+AS\s+(\w+)|\s+(\w+))?", re.IGNORECASE
+)
+
+
 class Scope(str, Enum):
     """Database scope selector for queries."""
 
@@ -44,6 +53,24 @@ class Scope(str, Enum):
     def __str__(self) -> str:  # pragma: no cover - trivial
         return self.value
 
+    @classmethod
+    def _missing_(cls, value: object) -> "Scope | None":
+        """Accept scope names regardless of case or surrounding whitespace."""
+
+        if isinstance(value, str):
+            return _SCOPE_BY_VALUE.get(value.strip().lower())
+        return None
+
+
+_SCOPE_BY_VALUE = {m.value: m for m in Scope}
+
+# Clause template per scope; ``ALL`` applies no filter.
+_CLAUSE_TEMPLATES = {
+    Scope.LOCAL: "{}.source_menace_id = ?",
+    Scope.GLOBAL: "{}.source_menace_id <> ?",
+    Scope.ALL: "",
+}
+
 
 def build_scope_clause(
     table_name: str, scope: Scope | str, menace_id: Any
@@ -56,12 +83,47 @@ def build_scope_clause(
     ``"all"``.
     """
 
-    scope = Scope(scope)
-    if scope is Scope.LOCAL:
-        return f"{table_name}.source_menace_id = ?", [menace_id]
-    if scope is Scope.GLOBAL:
-        return f"{table_name}.source_menace_id <> ?", [menace_id]
-    return "", []
+    clause = _scope_clause(table_name, scope)
+    return clause, ([menace_id] if clause else [])
+
+
+@lru_cache(maxsize=256)
+def _scope_clause(table_name: str, scope: Scope | str) -> str:
+    """Return the clause text for ``table_name``/``scope``.
+
+    Only a handful of tables and three scopes are ever combined so the result
+    is memoised; ``menace_id`` is a bound parameter and not part of the key.
+    ``Scope`` members hash and compare like their string values, so ``"local"``
+    and ``Scope.LOCAL`` share an entry and the enum coercion below only runs on
+    a cache miss.  Invalid scopes raise and are therefore never cached.
+    """
+
+    if type(scope) is not Scope:
+        scope = Scope(scope)
+    template = _CLAUSE_TEMPLATES[scope]
+    return template.format(table_name) if template else ""
+
+
+build_scope_clause.cache_clear = _scope_clause.cache_clear  # type: ignore[attr-defined]
+
+
+@lru_cache(maxsize=1024)
+def _query_shape(query: str) -> Tuple[bool, str | None]:
+    """Return ``(has_where, inferred_alias)`` for ``query``.
+
+    Callers typically pass the same module-level SQL templates over and over,
+    so both scans are memoised per query string.
+    """
+
+    alias = None
+    match = _FROM_RE.search(query)
+    if match:
+        alias = match.group(1)
+        if match.group(2):
+            alias = match.group(2)
+        elif match.group(3) and match.group(3).upper() not in {"WHERE", "JOIN", "ON"}:
+            alias = match.group(3)
+    return bool(_WHERE_RE.search(query)), alias
 
 
 def apply_scope(query: str, clause: str) -> str:
@@ -69,7 +131,7 @@ def apply_scope(query: str, clause: str) -> str:
 
     if not clause:
         return query
-    if "where" in query.lower():
+    if _query_shape(query)[0]:
         return f"{query} AND {clause}"
     return f"{query} WHERE {clause}"
 
@@ -91,18 +153,9 @@ def apply_scope_to_query(
 
     alias = table_alias
     if alias is None:
-        match = re.search(
-            r"FROM\s+([^\s,]+)(?:\s+AS\s+(\w+)|\s+(\w+))?",
-            query,
-            re.IGNORECASE,
-        )
-        if not match:
+        alias = _query_shape(query)[1]
+        if alias is None:
             raise ValueError("table alias could not be inferred; specify table_alias")
-        alias = match.group(1)
-        if match.group(2):
-            alias = match.group(2)
-        elif match.group(3) and match.group(3).upper() not in {"WHERE", "JOIN", "ON"}:
-            alias = match.group(3)
 
     clause, scope_params = build_scope_clause(alias, scope, menace_id)
     sql = apply_scope(query, clause)
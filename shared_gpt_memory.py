@@ -1,11 +1,28 @@
 from __future__ import annotations
 
-"""Shared GPT memory manager instance for all ChatGPT clients."""
+"""Shared GPT memory manager instance for all ChatGPT clients.
 
-from gpt_memory import GPTMemoryManager
-from shared_knowledge_module import LOCAL_KNOWLEDGE_MODULE
+``GPT_MEMORY_MANAGER`` is resolved on first access so importing this module
+does not build the shared knowledge module (and its database) up front.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - type hints only
+    from gpt_memory import GPTMemoryManager
+
+    # Single global GPT memory instance reused across bots
+    GPT_MEMORY_MANAGER: GPTMemoryManager
+
+
+def __getattr__(name: str) -> "GPTMemoryManager":
+    if name != "GPT_MEMORY_MANAGER":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from shared_knowledge_module import LOCAL_KNOWLEDGE_MODULE
+
+    manager = LOCAL_KNOWLEDGE_MODULE.memory
+    globals()[name] = manager
+    return manager
 
-# Single global GPT memory instance reused across bots
-GPT_MEMORY_MANAGER: GPTMemoryManager = LOCAL_KNOWLEDGE_MODULE.memory
 
 __all__ = ["GPT_MEMORY_MANAGER"]
@@ -16,37 +16,37 @@ logic.
 
 from __future__ import annotations
 
-# ``PromptBuildError`` and ``handle_failure`` live in ``prompt_failure``.  We try
-# the package-relative import first to support ``menace.*`` consumers and fall
-# back to the repository root module for direct execution from source.
-try:  # pragma: no cover - optional when package layout differs
-    from menace.prompt_failure import (  # type: ignore
-        PromptBuildError as _PromptBuildError,
-        handle_failure as _handle_failure,
-    )
-except ImportError:  # pragma: no cover - fallback during local execution
-    from prompt_failure import (  # type: ignore
-        PromptBuildError as _PromptBuildError,
-        handle_failure as _handle_failure,
-    )
+import importlib
+import importlib.util
+import sys
+
+# ``PromptBuildError`` and ``handle_failure`` live in the top-level
+# ``prompt_failure`` module; ``menace.prompt_failure`` merely re-exports it, so
+# importing the canonical module directly works for both layouts without
+# pulling in the ``menace`` package.
+from prompt_failure import (  # type: ignore
+    PromptBuildError as _PromptBuildError,
+    handle_failure as _handle_failure,
+)
 
 # Re-export ``ContextBuilder`` and related helpers from their canonical module.
 # The implementation lives at the repository root but is also mirrored under the
-# ``menace`` namespace when installed as a package.
+# ``menace`` namespace when installed as a package.  Probe for the package once
+# instead of letting a failed import raise and unwind when it is absent.
+_CONTEXT_BUILDER_MODULE = (
+    "menace.context_builder"
+    if "menace" in sys.modules or importlib.util.find_spec("menace") is not None
+    else "context_builder"
+)
 try:  # pragma: no cover - optional when executed from installed package
-    from menace.context_builder import (  # type: ignore
-        ContextBuilder,
-        build_prompt,
-        load_failed_tags,
-        record_failed_tags,
-    )
-except ImportError:  # pragma: no cover - fallback when running from source
-    from context_builder import (  # type: ignore
-        ContextBuilder,
-        build_prompt,
-        load_failed_tags,
-        record_failed_tags,
-    )
+    _context_builder = importlib.import_module(_CONTEXT_BUILDER_MODULE)
+except ImportError:  # pragma: no cover - package present but unusable
+    _context_builder = importlib.import_module("context_builder")
+
+ContextBuilder = _context_builder.ContextBuilder
+build_prompt = _context_builder.build_prompt
+load_failed_tags = _context_builder.load_failed_tags
+record_failed_tags = _context_builder.record_failed_tags
 
 
 PromptBuildError = _PromptBuildError
@@ -0,0 +1,49 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+@pytest.fixture
+def vector_service():
+    saved = {
+        name: mod
+        for name, mod in sys.modules.items()
+        if name == "vector_service" or name.startswith("vector_service.")
+    }
+    for name in saved:
+        del sys.modules[name]
+    try:
+        yield importlib.import_module("vector_service")
+    finally:
+        for name in list(sys.modules):
+            if name == "vector_service" or name.startswith("vector_service."):
+                del sys.modules[name]
+        sys.modules.update(saved)
+
+
+def test_import_does_not_load_submodules(vector_service):
+    assert "vector_service.retriever" not in sys.modules
+    assert "vector_service.context_builder" not in sys.modules
+    assert "ContextBuilder" not in vars(vector_service)
+    assert "ContextBuilder" in dir(vector_service)
+
+
+def test_names_resolve_on_first_access_and_are_cached(vector_service):
+    exc = vector_service.VectorServiceError
+    assert isinstance(exc, type) and issubclass(exc, Exception)
+    assert vars(vector_service)["VectorServiceError"] is exc
+    assert vector_service.VectorServiceError is exc
+
+
+def test_every_public_name_resolves(vector_service):
+    for name in vector_service.__all__:
+        assert getattr(vector_service, name) is not None
+
+
+def test_unknown_names_raise_attribute_error(vector_service):
+    with pytest.raises(AttributeError):
+        vector_service.does_not_exist